@@ -6,237 +6,203 @@ Loads settings from environment variables with sensible defaults.
 
 import os
 import logging
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import List
-from dotenv import load_dotenv
 
 # Get project root directory
 PROJECT_ROOT = Path(__file__).parent.parent
 
-# Load environment variables from .env file if it exists
-load_dotenv()
+# Set once the root logger has been configured, so repeated Config()
+# construction does not tear down and rebuild the handlers.
+_logging_configured = False
 
-class Config:
-    """Configuration class that loads all settings from environment variables."""
+# Accepted values checked by Config.validate_config. The lists keep the order
+# shown in warning messages; the frozensets are used for membership tests.
+_VALID_INTERVALS = ['1m', '2m', '5m', '15m', '30m', '60m', '90m', '1h', '1d', '5d', '1wk', '1mo', '3mo']
+_VALID_RISK_LEVELS = ['LOW', 'MEDIUM', 'HIGH']
+_VALID_LOG_LEVELS = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+_VALID_INTERVAL_SET = frozenset(_VALID_INTERVALS)
+_VALID_RISK_LEVEL_SET = frozenset(_VALID_RISK_LEVELS)
+_VALID_LOG_LEVEL_SET = frozenset(_VALID_LOG_LEVELS)
 
-    def __init__(self):
-        """Initialize configuration with environment variables."""
-        self._setup_logging()
 
-    # ==========================================================================
-    # OLLAMA CONFIGURATION
-    # ==========================================================================
+def _load_env_file():
+    """Load the nearest .env above this module, importing python-dotenv only if one exists."""
+    directory = Path(__file__).resolve().parent
+    for candidate in (directory, *directory.parents):
+        env_file = candidate / '.env'
+        if env_file.is_file():
+            from dotenv import load_dotenv
+            load_dotenv(env_file)
+            return
 
-    @property
-    def ollama_host(self) -> str:
-        """Ollama server host and port."""
-        return os.getenv('OLLAMA_HOST', 'http://localhost:11434')
 
-    @property
-    def ollama_model(self) -> str:
-        """AI model to use for analysis."""
-        return os.getenv('OLLAMA_MODEL', 'gpt-oss:20b')
+def _as_bool(value: str) -> bool:
+    """Interpret 'true' (any case) as True, anything else as False."""
+    return value.lower() == 'true'
 
-    @property
-    def ollama_timeout(self) -> int:
-        """Ollama request timeout in seconds."""
-        return int(os.getenv('OLLAMA_TIMEOUT', '120'))
 
-    # ==========================================================================
-    # DATABASE CONFIGURATION
-    # ==========================================================================
+def _as_list(value: str) -> List[str]:
+    """Split a comma-separated value into stripped items."""
+    return [item.strip() for item in value.split(',')]
 
-    @property
-    def database_path(self) -> str:
-        """SQLite database file path."""
-        default_path = str(PROJECT_ROOT / 'data' / 'gold_prices.db')
-        env_path = os.getenv('DATABASE_PATH', default_path)
 
-        # If the path is relative, make it relative to PROJECT_ROOT
-        if not os.path.isabs(env_path):
-            return str(PROJECT_ROOT / env_path)
-        return env_path
+def _as_path(*base: str):
+    """Build a caster that resolves relative paths against PROJECT_ROOT/<base>."""
+    root = PROJECT_ROOT.joinpath(*base)
 
-    # ==========================================================================
-    # TRADING ANALYSIS CONFIGURATION
-    # ==========================================================================
+    def cast(value: str) -> str:
+        if not os.path.isabs(value):
+            return str(root / value)
+        return value
 
-    @property
-    def default_interval(self) -> str:
-        """Default analysis interval."""
-        return os.getenv('DEFAULT_INTERVAL', '15m')
+    return cast
 
-    @property
-    def default_analysis_hours(self) -> int:
-        """Default hours of data to analyze."""
-        return int(os.getenv('DEFAULT_ANALYSIS_HOURS', '24'))
 
-    @property
-    def prompt_file(self) -> str:
-        """Trading prompt template file path."""
-        default_path = str(PROJECT_ROOT / 'config' / 'trading_prompt.txt')
-        env_path = os.getenv('PROMPT_FILE', default_path)
+@lru_cache(maxsize=1)
+def _validate(snapshot: tuple) -> tuple:
+    """Validate a Config snapshot and return the warnings/errors as a tuple.
 
-        # If the path is relative, make it relative to PROJECT_ROOT
-        if not os.path.isabs(env_path):
-            return str(PROJECT_ROOT / 'config' / env_path)
-        return env_path
+    Cached on the snapshot, so repeated validation of unchanged settings is
+    free. Config.refresh() bumps the version in the snapshot to invalidate it.
+    """
+    (_, default_interval, default_risk_level, log_level, prompt_file,
+     default_analysis_hours, default_fetch_days, default_position_size) = snapshot
+    warnings = []
 
-    # ==========================================================================
-    # DATA FETCHING CONFIGURATION
-    # ==========================================================================
+    # Check if .env file exists
+    if not os.path.exists('.env'):
+        warnings.append("No .env file found. Using default values. Copy .env.example to .env for customization.")
 
-    @property
-    def default_fetch_days(self) -> int:
-        """Default number of days to fetch."""
-        return int(os.getenv('DEFAULT_FETCH_DAYS', '14'))
+    # Validate intervals
+    if default_interval not in _VALID_INTERVAL_SET:
+        warnings.append(f"Invalid default interval '{default_interval}'. Valid options: {_VALID_INTERVALS}")
 
-    @property
-    def gold_symbol(self) -> str:
-        """Gold symbol to track."""
-        return os.getenv('GOLD_SYMBOL', 'GC=F')
+    # Validate risk level
+    if default_risk_level not in _VALID_RISK_LEVEL_SET:
+        warnings.append(f"Invalid default risk level '{default_risk_level}'. Valid options: {_VALID_RISK_LEVELS}")
 
-    @property
-    def yfinance_timeout(self) -> int:
-        """Yahoo Finance request timeout in seconds."""
-        return int(os.getenv('YFINANCE_TIMEOUT', '30'))
+    # Validate log level
+    if log_level not in _VALID_LOG_LEVEL_SET:
+        warnings.append(f"Invalid log level '{log_level}'. Valid options: {_VALID_LOG_LEVELS}")
 
-    # ==========================================================================
-    # NEWS FETCHING CONFIGURATION
-    # ==========================================================================
+    # Check for prompt file
+    if not os.path.exists(prompt_file):
+        warnings.append(f"Prompt file '{prompt_file}' not found.")
 
-    @property
-    def max_articles_per_symbol(self) -> int:
-        """Maximum articles to fetch per symbol."""
-        return int(os.getenv('MAX_ARTICLES_PER_SYMBOL', '30'))
-
-    @property
-    def news_symbols(self) -> List[str]:
-        """News symbols to track."""
-        symbols_str = os.getenv('NEWS_SYMBOLS', 'GC=F,GOLD,GLD,IAU')
-        return [symbol.strip() for symbol in symbols_str.split(',')]
-
-    @property
-    def default_news_days(self) -> int:
-        """Default news cache days."""
-        return int(os.getenv('DEFAULT_NEWS_DAYS', '7'))
-
-    @property
-    def enable_sentiment_analysis(self) -> bool:
-        """Enable news sentiment analysis."""
-        return os.getenv('ENABLE_SENTIMENT_ANALYSIS', 'true').lower() == 'true'
-
-    @property
-    def auto_categorize_news(self) -> bool:
-        """Auto-categorize news articles."""
-        return os.getenv('AUTO_CATEGORIZE_NEWS', 'true').lower() == 'true'
-
-    @property
-    def news_fetch_interval(self) -> int:
-        """News fetch interval in hours."""
-        return int(os.getenv('NEWS_FETCH_INTERVAL', '6'))
+    # Validate numeric values
+    if default_analysis_hours <= 0:
+        warnings.append("DEFAULT_ANALYSIS_HOURS must be greater than 0")
 
-    # ==========================================================================
-    # LOGGING CONFIGURATION
-    # ==========================================================================
-
-    @property
-    def log_level(self) -> str:
-        """Log level."""
-        return os.getenv('LOG_LEVEL', 'INFO').upper()
-
-    @property
-    def log_format(self) -> str:
-        """Log format string."""
-        return os.getenv('LOG_FORMAT', '%(asctime)s - %(levelname)s - %(message)s')
-
-    @property
-    def enable_file_logging(self) -> bool:
-        """Enable file logging."""
-        return os.getenv('ENABLE_FILE_LOGGING', 'false').lower() == 'true'
-
-    @property
-    def log_file(self) -> str:
-        """Log file path."""
-        default_path = str(PROJECT_ROOT / 'logs' / 'gold_digger.log')
-        env_path = os.getenv('LOG_FILE', default_path)
-
-        # If the path is relative, make it relative to PROJECT_ROOT
-        if not os.path.isabs(env_path):
-            return str(PROJECT_ROOT / 'logs' / env_path)
-        return env_path
-
-    # ==========================================================================
-    # EXPORT CONFIGURATION
-    # ==========================================================================
-
-    @property
-    def export_dir(self) -> str:
-        """Export directory for CSV files."""
-        default_path = str(PROJECT_ROOT / 'data' / 'exports')
-        env_path = os.getenv('EXPORT_DIR', default_path)
-
-        # If the path is relative, make it relative to PROJECT_ROOT
-        if not os.path.isabs(env_path):
-            return str(PROJECT_ROOT / 'data' / env_path)
-        return env_path
+    if default_fetch_days <= 0:
+        warnings.append("DEFAULT_FETCH_DAYS must be greater than 0")
 
-    @property
-    def export_include_volume(self) -> bool:
-        """Include volume in exports."""
-        return os.getenv('EXPORT_INCLUDE_VOLUME', 'true').lower() == 'true'
-
-    # ==========================================================================
-    # API CONFIGURATION
-    # ==========================================================================
+    if default_position_size <= 0 or default_position_size > 1:
+        warnings.append("DEFAULT_POSITION_SIZE must be between 0 and 1")
 
-    @property
-    def api_delay(self) -> float:
-        """Rate limiting delay between API calls."""
-        return float(os.getenv('API_DELAY', '1.0'))
+    return tuple(warnings)
 
-    @property
-    def max_retries(self) -> int:
-        """Maximum retries for failed API calls."""
-        return int(os.getenv('MAX_RETRIES', '3'))
 
-    # ==========================================================================
-    # RISK MANAGEMENT DEFAULTS
-    # ==========================================================================
-
-    @property
-    def default_risk_level(self) -> str:
-        """Default risk level for analysis."""
-        return os.getenv('DEFAULT_RISK_LEVEL', 'MEDIUM').upper()
-
-    @property
-    def default_position_size(self) -> float:
-        """Default position size as percentage of portfolio."""
-        return float(os.getenv('DEFAULT_POSITION_SIZE', '0.05'))
-
-    # ==========================================================================
-    # DEVELOPMENT/DEBUG OPTIONS
-    # ==========================================================================
-
-    @property
-    def debug_mode(self) -> bool:
-        """Enable debug mode."""
-        return os.getenv('DEBUG_MODE', 'false').lower() == 'true'
-
-    @property
-    def skip_model_check(self) -> bool:
-        """Skip model availability check."""
-        return os.getenv('SKIP_MODEL_CHECK', 'false').lower() == 'true'
+class Config:
+    """Configuration class that loads all settings from environment variables.
+
+    Every setting is described by one ``_SPEC`` entry of
+    ``(attribute, env var, default, caster)``. The table is walked once in
+    ``__init__`` and the results are stored as plain attributes. Call
+    ``refresh()`` to pick up changes made to ``os.environ`` after that point.
+    """
+
+    _SPEC = [
+        # ======================================================================
+        # OLLAMA CONFIGURATION
+        # ======================================================================
+        ('ollama_host', 'OLLAMA_HOST', 'http://localhost:11434', str),
+        ('ollama_model', 'OLLAMA_MODEL', 'gpt-oss:20b', str),
+        ('ollama_timeout', 'OLLAMA_TIMEOUT', '120', int),
+
+        # ======================================================================
+        # DATABASE CONFIGURATION
+        # ======================================================================
+        ('database_path', 'DATABASE_PATH',
+         str(PROJECT_ROOT / 'data' / 'gold_prices.db'), _as_path()),
+
+        # ======================================================================
+        # TRADING ANALYSIS CONFIGURATION
+        # ======================================================================
+        ('default_interval', 'DEFAULT_INTERVAL', '15m', str),
+        ('default_analysis_hours', 'DEFAULT_ANALYSIS_HOURS', '24', int),
+        ('prompt_file', 'PROMPT_FILE',
+         str(PROJECT_ROOT / 'config' / 'trading_prompt.txt'), _as_path('config')),
+
+        # ======================================================================
+        # DATA FETCHING CONFIGURATION
+        # ======================================================================
+        ('default_fetch_days', 'DEFAULT_FETCH_DAYS', '14', int),
+        ('gold_symbol', 'GOLD_SYMBOL', 'GC=F', str),
+        ('yfinance_timeout', 'YFINANCE_TIMEOUT', '30', int),
+
+        # ======================================================================
+        # NEWS FETCHING CONFIGURATION
+        # ======================================================================
+        ('max_articles_per_symbol', 'MAX_ARTICLES_PER_SYMBOL', '30', int),
+        ('news_symbols', 'NEWS_SYMBOLS', 'GC=F,GOLD,GLD,IAU', _as_list),
+        ('default_news_days', 'DEFAULT_NEWS_DAYS', '7', int),
+        ('enable_sentiment_analysis', 'ENABLE_SENTIMENT_ANALYSIS', 'true', _as_bool),
+        ('auto_categorize_news', 'AUTO_CATEGORIZE_NEWS', 'true', _as_bool),
+        ('news_fetch_interval', 'NEWS_FETCH_INTERVAL', '6', int),
+
+        # ======================================================================
+        # LOGGING CONFIGURATION
+        # ======================================================================
+        ('log_level', 'LOG_LEVEL', 'INFO', str.upper),
+        ('log_format', 'LOG_FORMAT', '%(asctime)s - %(levelname)s - %(message)s', str),
+        ('enable_file_logging', 'ENABLE_FILE_LOGGING', 'false', _as_bool),
+        ('log_file', 'LOG_FILE',
+         str(PROJECT_ROOT / 'logs' / 'gold_digger.log'), _as_path('logs')),
+
+        # ======================================================================
+        # EXPORT CONFIGURATION
+        # ======================================================================
+        ('export_dir', 'EXPORT_DIR',
+         str(PROJECT_ROOT / 'data' / 'exports'), _as_path('data')),
+        ('export_include_volume', 'EXPORT_INCLUDE_VOLUME', 'true', _as_bool),
+
+        # ======================================================================
+        # API CONFIGURATION
+        # ======================================================================
+        ('api_delay', 'API_DELAY', '1.0', float),
+        ('max_retries', 'MAX_RETRIES', '3', int),
+
+        # ======================================================================
+        # RISK MANAGEMENT DEFAULTS
+        # ======================================================================
+        ('default_risk_level', 'DEFAULT_RISK_LEVEL', 'MEDIUM', str.upper),
+        ('default_position_size', 'DEFAULT_POSITION_SIZE', '0.05', float),
+
+        # ======================================================================
+        # DEVELOPMENT/DEBUG OPTIONS
+        # ======================================================================
+        ('debug_mode', 'DEBUG_MODE', 'false', _as_bool),
+        ('skip_model_check', 'SKIP_MODEL_CHECK', 'false', _as_bool),
+        ('use_mock_data', 'USE_MOCK_DATA', 'false', _as_bool),
+        ('use_mock_news', 'USE_MOCK_NEWS', 'false', _as_bool),
+    ]
 
-    @property
-    def use_mock_data(self) -> bool:
-        """Use mock data instead of real API calls."""
-        return os.getenv('USE_MOCK_DATA', 'false').lower() == 'true'
+    def __init__(self):
+        """Initialize configuration with environment variables."""
+        # Load environment variables from .env file if it exists
+        _load_env_file()
+        self._load()
+        self._setup_logging()
 
-    @property
-    def use_mock_news(self) -> bool:
-        """Use mock news data for testing."""
-        return os.getenv('USE_MOCK_NEWS', 'false').lower() == 'true'
+    def _load(self):
+        """Read and coerce every setting in ``_SPEC`` in a single pass."""
+        self._version = getattr(self, '_version', -1) + 1
+        getenv = os.getenv
+        for attr, env, default, cast in self._SPEC:
+            setattr(self, attr, cast(getenv(env, default)))
 
     # ==========================================================================
     # HELPER METHODS
@@ -244,6 +210,10 @@ class Config:
 
     def _setup_logging(self):
         """Setup logging configuration based on environment variables."""
+        global _logging_configured
+        if _logging_configured:
+            return
+
         log_level = getattr(logging, self.log_level, logging.INFO)
 
         # Configure basic logging
@@ -262,6 +232,15 @@ class Config:
             handlers=handlers,
             force=True  # Override any existing configuration
         )
+        _logging_configured = True
+
+    def refresh(self):
+        """Re-read all settings from the environment."""
+        self._load()
+
+    def init(self):
+        """Prepare the runtime environment. Called by application entry points."""
+        self.ensure_directories()
 
     def ensure_directories(self):
         """Create necessary directories if they don't exist."""
@@ -275,44 +254,22 @@ class Config:
             if directory and directory != Path('.'):
                 Path(directory).mkdir(parents=True, exist_ok=True)
 
+    def _snapshot(self) -> tuple:
+        """Settings that validate_config depends on, as a hashable cache key."""
+        return (
+            self._version,
+            self.default_interval,
+            self.default_risk_level,
+            self.log_level,
+            self.prompt_file,
+            self.default_analysis_hours,
+            self.default_fetch_days,
+            self.default_position_size,
+        )
+
     def validate_config(self) -> list:
         """Validate configuration and return list of warnings/errors."""
-        warnings = []
-
-        # Check if .env file exists
-        if not Path('.env').exists():
-            warnings.append("No .env file found. Using default values. Copy .env.example to .env for customization.")
-
-        # Validate intervals
-        valid_intervals = ['1m', '2m', '5m', '15m', '30m', '60m', '90m', '1h', '1d', '5d', '1wk', '1mo', '3mo']
-        if self.default_interval not in valid_intervals:
-            warnings.append(f"Invalid default interval '{self.default_interval}'. Valid options: {valid_intervals}")
-
-        # Validate risk level
-        valid_risk_levels = ['LOW', 'MEDIUM', 'HIGH']
-        if self.default_risk_level not in valid_risk_levels:
-            warnings.append(f"Invalid default risk level '{self.default_risk_level}'. Valid options: {valid_risk_levels}")
-
-        # Validate log level
-        valid_log_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if self.log_level not in valid_log_levels:
-            warnings.append(f"Invalid log level '{self.log_level}'. Valid options: {valid_log_levels}")
-
-        # Check for prompt file
-        if not Path(self.prompt_file).exists():
-            warnings.append(f"Prompt file '{self.prompt_file}' not found.")
-
-        # Validate numeric values
-        if self.default_analysis_hours <= 0:
-            warnings.append("DEFAULT_ANALYSIS_HOURS must be greater than 0")
-
-        if self.default_fetch_days <= 0:
-            warnings.append("DEFAULT_FETCH_DAYS must be greater than 0")
-
-        if self.default_position_size <= 0 or self.default_position_size > 1:
-            warnings.append("DEFAULT_POSITION_SIZE must be between 0 and 1")
-
-        return warnings
+        return list(_validate(self._snapshot()))
 
     def print_config_summary(self):
         """Print a summary of current configuration."""
@@ -350,7 +307,7 @@ class Config:
                 return
 
         env_content = f"""# Gold Digger Configuration
-# Generated on {os.popen('date').read().strip()}
+# Generated on {datetime.now().isoformat(timespec='seconds')}
 
 # Ollama Configuration
 OLLAMA_HOST={self.ollama_host}
@@ -397,6 +354,9 @@ USE_MOCK_DATA={'true' if self.use_mock_data else 'false'}
         with open('.env', 'w') as f:
             f.write(env_content)
 
+        # The .env check in validate_config has a different answer now
+        _validate.cache_clear()
+
         print("✅ .env file created successfully!")
 
 
@@ -419,6 +379,3 @@ if __name__ == "__main__":
         response = input("\nCreate .env file with current settings? (y/N): ")
         if response.lower() == 'y':
             config.create_env_file()
-else:
-    # When imported, just ensure directories exist
-    config.ensure_directories()
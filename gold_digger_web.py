@@ -11,36 +11,49 @@ import sys
 import os
 import subprocess
 import argparse
+import hashlib
+import importlib.util
 from pathlib import Path
 
+def deps_sentinel():
+    """Marker file recording that this interpreter passed the dependency check."""
+    # Keyed on the interpreter and requirements.txt so a new venv or changed
+    # requirements invalidate it automatically
+    digest = hashlib.sha1(sys.executable.encode())
+    try:
+        digest.update((Path(__file__).parent / 'requirements.txt').read_bytes())
+    except OSError:
+        pass
+    return Path.home() / '.cache' / 'gold-digger' / f'deps-web-{digest.hexdigest()}.ok'
+
 def check_dependencies():
     """Check if required dependencies are installed."""
-    try:
-        import flask
-        import pandas
-        import yfinance
-        import plotly
+    sentinel = deps_sentinel()
+    if sentinel.exists():
         return True
-    except ImportError as e:
-        print(f"❌ Missing dependency: {e}")
+
+    # find_spec locates packages without running their (slow) import-time code
+    missing = [name for name in ("flask", "pandas", "yfinance", "plotly")
+               if importlib.util.find_spec(name) is None]
+    if missing:
+        print(f"❌ Missing dependencies: {', '.join(missing)}")
         print("Please install dependencies with: pip install -r requirements.txt")
         return False
 
+    try:
+        sentinel.parent.mkdir(parents=True, exist_ok=True)
+        sentinel.touch()
+    except OSError:
+        pass
+    return True
+
 def setup_environment():
     """Setup the environment for the web application."""
-    # Get project root directory
-    project_root = Path(__file__).parent
-
-    # Add src directory to Python path for imports
-    src_dir = project_root / 'src'
-    config_dir = project_root / 'config'
-
-    if str(src_dir) not in sys.path:
-        sys.path.insert(0, str(src_dir))
-    if str(config_dir) not in sys.path:
-        sys.path.insert(0, str(config_dir))
-    if str(project_root) not in sys.path:
-        sys.path.insert(0, str(project_root))
+    # The project root makes web and src importable as packages; web.app
+    # adds the src and config directories it needs itself
+    project_root = str(Path(__file__).resolve().parent)
+    if project_root not in sys.path:
+        sys.path.insert(0, project_root)
 
 def launch_web_app(port=5000, host='localhost', debug=False, production=False):
     """Launch the Gold Digger web application."""
@@ -64,21 +77,15 @@ def launch_web_app(port=5000, host='localhost', debug=False, production=False):
         print(f"🌐 Starting in PRODUCTION mode on http://{host}:{port}")
     elif debug:
         os.environ['FLASK_ENV'] = 'development'
+        os.environ['GD_USE_RELOADER'] = '1'
         print(f"🔧 Starting in DEBUG mode on http://{host}:{port}")
     else:
         os.environ['FLASK_ENV'] = 'development'
         print(f"🌐 Starting in DEVELOPMENT mode on http://{host}:{port}")
 
     try:
-        # Import and run the web app from the web directory
-        web_dir = Path(__file__).parent / 'web'
-        sys.path.insert(0, str(web_dir))
-
-        # Change to web directory
-        os.chdir(web_dir)
-
-        # Import and run the web app
-        from app import main as web_main
+        # Import and run the web app as a package module
+        from web.app import main as web_main
         web_main()
 
     except ImportError as e:
@@ -23,24 +23,25 @@ Examples:
 
 import sys
 import os
-import argparse
 from pathlib import Path
+from types import SimpleNamespace
 
 # Add src directory to Python path
 PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT / 'src'))
 
-# Import configuration
+# Configuration is imported by the functions that need it, so --help and
+# --version return without loading it (and its logging setup)
 sys.path.insert(0, str(PROJECT_ROOT / 'config'))
-from config import get_config
 
 
 def setup_environment():
     """Setup the Gold Digger environment."""
+    from config import get_config
     config = get_config()
 
     # Create necessary directories
-    config.ensure_directories()
+    config.init()
 
     # Show welcome message
     print("🏆 Gold Digger Trading Analysis System")
@@ -74,18 +75,12 @@ def launch_web(port=None):
     """Launch the web interface."""
     print("🌐 Launching Web Interface...")
     try:
-        # Setup paths for web app imports
-        web_dir = PROJECT_ROOT / 'web'
-        sys.path.insert(0, str(web_dir))
-        sys.path.insert(0, str(PROJECT_ROOT / 'config'))
-
-        # Change to web directory
-        os.chdir(web_dir)
-
         if port:
             os.environ['PORT'] = str(port)
 
-        from app import main as web_main
+        # web is a package under the project root (already on sys.path as the
+        # script directory), so no path edits or chdir are needed
+        from web.app import main as web_main
         web_main()
     except ImportError as e:
         print(f"❌ Error importing web module: {e}")
@@ -143,6 +138,7 @@ def configure_app():
         config_main()
     except ImportError:
         # Fallback configuration
+        from config import get_config
         config = get_config()
         config.print_config_summary()
 
@@ -151,8 +147,13 @@ def configure_app():
             config.create_env_file()
 
 
-def main():
-    """Main entry point with command-line argument parsing."""
+COMMANDS = ('terminal', 'tui', 'web', 'fetch', 'analyze', 'config')
+
+
+def build_parser():
+    """Build the full argparse parser (help, version and unusual option forms)."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Gold Digger - Professional Gold Trading Analysis System',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -168,7 +169,7 @@ Examples:
 
     parser.add_argument(
         'command',
-        choices=['terminal', 'tui', 'web', 'fetch', 'analyze', 'config'],
+        choices=COMMANDS,
         help='Command to execute'
     )
 
@@ -197,7 +198,42 @@ Examples:
         version='Gold Digger v1.0.0'
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def parse_fast(argv):
+    """Parse 'command [--port N] [--days N] [--symbols S ...]' without argparse.
+
+    Returns None for anything else (help, version, --opt=value, bad input)
+    so the caller falls back to build_parser().
+    """
+    if not argv or argv[0] not in COMMANDS:
+        return None
+
+    args = SimpleNamespace(command=argv[0], port=None, days=7, symbols=None)
+    rest = argv[1:]
+    i = 0
+    while i < len(rest):
+        option = rest[i]
+        if option in ('--port', '--days') and i + 1 < len(rest) and rest[i + 1].isdigit():
+            setattr(args, option[2:], int(rest[i + 1]))
+            i += 2
+        elif option == '--symbols' and i + 1 < len(rest) and not rest[i + 1].startswith('-'):
+            end = i + 1
+            while end < len(rest) and not rest[end].startswith('-'):
+                end += 1
+            args.symbols = rest[i + 1:end]
+            i = end
+        else:
+            return None
+
+    return args
+
+
+def main():
+    """Main entry point with command-line argument parsing."""
+    # The common invocations skip importing and building argparse entirely
+    args = parse_fast(sys.argv[1:]) or build_parser().parse_args()
 
     # Setup environment
     setup_environment()
@@ -256,6 +256,8 @@ def export_data():
 
 def main():
     """Main function with comprehensive analysis."""
+    config.init()
+
     parser = argparse.ArgumentParser(description='Complete Gold Trading Analysis')
     parser.add_argument('--days', '-d', type=int,
                        help=f'Number of days to fetch (default: {config.default_fetch_days})')
@@ -5,15 +5,23 @@ Fetches gold prices (GC=F) in 15m and 30m intervals for the last 14 days.
 Caches results in SQLite to avoid duplicate API calls.
 """
 
+from __future__ import annotations
+
 import sqlite3
-import yfinance as yf
-import pandas as pd
 from datetime import datetime, timedelta
 import logging
 import sys
-from typing import Optional, Tuple
+import time
+from typing import TYPE_CHECKING, Optional, Tuple
 import argparse
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import repeat
+
+# pandas is imported where it is used, so --config-summary and cache-only
+# paths that never touch a DataFrame skip its import cost
+if TYPE_CHECKING:
+    import pandas as pd
 
 # Add config path for imports
 config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'config')
@@ -24,65 +32,125 @@ from config import get_config
 config = get_config()
 logger = logging.getLogger(__name__)
 
+# Width of one bar per interval
+INTERVAL_DELTA = {"15m": timedelta(minutes=15), "30m": timedelta(minutes=30)}
+
+# WAL lets readers run while a save commits and synchronous=NORMAL drops the
+# per-commit fsync; mmap and a larger page cache keep repeated range reads warm
+_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-65536',
+)
+
+# Price rows are keyed and always read by datetime, so the table is stored as a
+# single B-tree clustered on it instead of a rowid table plus a key index
+_PRICE_TABLE_DDL = '''
+    CREATE TABLE IF NOT EXISTS {table} (
+        datetime TEXT PRIMARY KEY,
+        open REAL,
+        high REAL,
+        low REAL,
+        close REAL,
+        volume INTEGER,
+        created_at TEXT
+    ) WITHOUT ROWID
+'''
+
+def _format_datetimes(index: pd.DatetimeIndex) -> pd.Index:
+    """Format timestamps as '%Y-%m-%d %H:%M:%S%z' without a per-row strftime."""
+    import pandas as pd
+
+    if index.tz is None:
+        return index.astype('datetime64[s]').astype(str)
+
+    # Cast the wall-clock part in one go and map the handful of distinct UTC
+    # offsets to their ±HHMM suffix
+    local = index.tz_localize(None)
+    minutes = (local - index.tz_convert('UTC').tz_localize(None)) // pd.Timedelta(minutes=1)
+    suffixes = {m: f"{'-' if m < 0 else '+'}{abs(m) // 60:02d}{abs(m) % 60:02d}" for m in minutes.unique()}
+    return local.astype('datetime64[s]').astype(str) + minutes.map(suffixes)
+
+
 class GoldPriceFetcher:
     def __init__(self, db_path: Optional[str] = None):
         """Initialize the gold price fetcher with SQLite database."""
         self.db_path = db_path or config.database_path
         self.symbol = config.gold_symbol
+        self._conn = self._connect()
+        # MIN/MAX per interval, only stale once save_to_database writes
+        self._range_cache: dict[str, Tuple[Optional[datetime], Optional[datetime]]] = {}
+        # Created on first fetch so cache-only runs never import yfinance
+        self._tickers = {}
         self.init_database()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open the fetcher's long-lived connection with write-friendly settings."""
+        # The terminal may drive one fetcher from worker threads
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
     def init_database(self):
         """Initialize the SQLite database with required tables."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-
-                # Create table for 15m intervals
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS gold_prices_15m (
-                        datetime TEXT PRIMARY KEY,
-                        open REAL,
-                        high REAL,
-                        low REAL,
-                        close REAL,
-                        volume INTEGER,
-                        created_at TEXT
-                    )
-                ''')
-
-                # Create table for 30m intervals
-                cursor.execute('''
-                    CREATE TABLE IF NOT EXISTS gold_prices_30m (
-                        datetime TEXT PRIMARY KEY,
-                        open REAL,
-                        high REAL,
-                        low REAL,
-                        close REAL,
-                        volume INTEGER,
-                        created_at TEXT
-                    )
-                ''')
-
-                conn.commit()
+            with self._conn as conn:
+                # One table per interval (15m, 30m)
+                table_names = [f"gold_prices_{interval}" for interval in ("15m", "30m")]
+                for table_name in table_names:
+                    self._rebuild_without_rowid(conn, table_name)
+                conn.executescript(';'.join(_PRICE_TABLE_DDL.format(table=t) for t in table_names))
+
                 logger.info(f"Database initialized at {self.db_path}")
 
         except sqlite3.Error as e:
             logger.error(f"Database initialization error: {e}")
             sys.exit(1)
 
+    @staticmethod
+    def _rebuild_without_rowid(conn: sqlite3.Connection, table_name: str):
+        """Rebuild a price table created before the tables became WITHOUT ROWID."""
+        row = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,)
+        ).fetchone()
+        if row is None or 'WITHOUT ROWID' in row[0].upper():
+            return
+
+        logger.info(f"Rebuilding {table_name} as a WITHOUT ROWID table")
+        conn.executescript(f'''
+            BEGIN;
+            ALTER TABLE {table_name} RENAME TO {table_name}_old;
+            {_PRICE_TABLE_DDL.format(table=table_name)};
+            INSERT INTO {table_name}
+                SELECT datetime, open, high, low, close, volume, created_at
+                FROM {table_name}_old WHERE datetime IS NOT NULL;
+            DROP TABLE {table_name}_old;
+            COMMIT;
+        ''')
+
     def get_cached_date_range(self, interval: str) -> Tuple[Optional[datetime], Optional[datetime]]:
         """Get the date range of cached data for a specific interval."""
+        if interval in self._range_cache:
+            return self._range_cache[interval]
+
         table_name = f"gold_prices_{interval}"
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute(f'''
-                    SELECT MIN(datetime), MAX(datetime)
-                    FROM {table_name}
-                ''')
+            with self._conn as conn:
+                # Separate subqueries let SQLite read each end of the key B-tree
+                # directly; MIN and MAX together in one SELECT force a full scan
+                result = conn.execute(f'''
+                    SELECT (SELECT MIN(datetime) FROM {table_name}),
+                           (SELECT MAX(datetime) FROM {table_name})
+                ''').fetchone()
 
-                result = cursor.fetchone()
                 if result and result[0] and result[1]:
                     min_date = datetime.fromisoformat(result[0])
                     max_date = datetime.fromisoformat(result[1])
@@ -93,9 +161,11 @@ class GoldPriceFetcher:
                     if max_date.tzinfo is None:
                         max_date = max_date.replace(tzinfo=datetime.now().astimezone().tzinfo)
 
-                    return min_date, max_date
+                    self._range_cache[interval] = (min_date, max_date)
+                else:
+                    self._range_cache[interval] = (None, None)
 
-                return None, None
+                return self._range_cache[interval]
 
         except sqlite3.Error as e:
             logger.error(f"Error getting cached date range: {e}")
@@ -119,76 +189,68 @@ class GoldPriceFetcher:
         if end_date > cached_max:
             missing_ranges.append((cached_max + timedelta(minutes=1), end_date))
 
-        return missing_ranges
+        # A gap shorter than one bar cannot hold a new candle, so skip the request
+        bar = INTERVAL_DELTA.get(interval, timedelta(0))
+        return [(start, end) for start, end in missing_ranges if end - start >= bar]
+
+    def _get_ticker(self, interval: str):
+        """Return the Ticker reused for this interval's first attempt and retries."""
+        # yfinance already shares one HTTP session process-wide; a Ticker per interval
+        # keeps the concurrent fetches from sharing its mutable history state
+        ticker = self._tickers.get(interval)
+        if ticker is None:
+            import yfinance as yf
+            ticker = self._tickers[interval] = yf.Ticker(self.symbol)
+        return ticker
+
+    def _do_fetch(self, start_date: datetime, end_date: datetime, interval: str) -> Optional[pd.DataFrame]:
+        """Run one yfinance history request; None when it returns no rows.
+
+        The frame keeps yfinance's DatetimeIndex; save_to_database formats it.
+        """
+        ticker = self._get_ticker(interval)
+        data = ticker.history(
+            start=start_date.strftime('%Y-%m-%d'),
+            end=(end_date + timedelta(days=1)).strftime('%Y-%m-%d'),
+            interval=interval,
+            prepost=True,
+            actions=False,
+            timeout=config.yfinance_timeout
+        )
+
+        return None if data.empty else data
 
     def fetch_gold_data(self, start_date: datetime, end_date: datetime, interval: str) -> Optional[pd.DataFrame]:
         """Fetch gold price data from yfinance."""
-        try:
-            if config.use_mock_data:
-                logger.info(f"Using mock data for {interval} interval")
-                return self._get_mock_data(start_date, end_date, interval)
+        if config.use_mock_data:
+            logger.info(f"Using mock data for {interval} interval")
+            return self._get_mock_data(start_date, end_date, interval)
 
-            logger.info(f"Fetching {interval} data from {start_date} to {end_date}")
+        logger.info(f"Fetching {interval} data from {start_date} to {end_date}")
 
-            # Add delay for rate limiting
+        for attempt in range(config.max_retries + 1):
+            if attempt:
+                logger.info(f"Retrying... ({attempt}/{config.max_retries})")
+
+            # Rate-limit delay, growing with each retry
             if config.api_delay > 0:
-                import time
-                time.sleep(config.api_delay)
-
-            ticker = yf.Ticker(self.symbol)
-            data = ticker.history(
-                start=start_date.strftime('%Y-%m-%d'),
-                end=(end_date + timedelta(days=1)).strftime('%Y-%m-%d'),
-                interval=interval,
-                prepost=True,
-                actions=False,
-                timeout=config.yfinance_timeout
-            )
-
-            if data.empty:
-                logger.warning(f"No data received for {interval} interval")
-                return None
+                time.sleep(config.api_delay * max(attempt, 1))
 
-            # Reset index to make datetime a column
-            data.reset_index(inplace=True)
+            try:
+                data = self._do_fetch(start_date, end_date, interval)
+            except Exception as e:
+                logger.warning(f"Attempt {attempt + 1} failed: {e}")
+                continue
 
-            # Convert datetime to string for SQLite storage
-            data['Datetime'] = data['Datetime'].dt.strftime('%Y-%m-%d %H:%M:%S%z')
+            if data is None:
+                logger.warning(f"No data received for {interval} interval")
+                return None
 
             logger.info(f"Fetched {len(data)} records for {interval} interval")
             return data
 
-        except Exception as e:
-            logger.error(f"Error fetching data: {e}")
-            # Retry logic
-            retries = 0
-            while retries < config.max_retries:
-                retries += 1
-                logger.info(f"Retrying... ({retries}/{config.max_retries})")
-                try:
-                    import time
-                    time.sleep(config.api_delay * retries)  # Exponential backoff
-
-                    ticker = yf.Ticker(self.symbol)
-                    data = ticker.history(
-                        start=start_date.strftime('%Y-%m-%d'),
-                        end=(end_date + timedelta(days=1)).strftime('%Y-%m-%d'),
-                        interval=interval,
-                        prepost=True,
-                        actions=False,
-                        timeout=config.yfinance_timeout
-                    )
-
-                    if not data.empty:
-                        data.reset_index(inplace=True)
-                        data['Datetime'] = data['Datetime'].dt.strftime('%Y-%m-%d %H:%M:%S%z')
-                        logger.info(f"Retry successful: Fetched {len(data)} records for {interval} interval")
-                        return data
-                except Exception as retry_e:
-                    logger.warning(f"Retry {retries} failed: {retry_e}")
-
-            logger.error(f"All retries failed for {interval} interval")
-            return None
+        logger.error(f"All retries failed for {interval} interval")
+        return None
 
     def _get_mock_data(self, start_date: datetime, end_date: datetime, interval: str) -> Optional[pd.DataFrame]:
         """Generate mock data for testing purposes."""
@@ -197,42 +259,36 @@ class GoldPriceFetcher:
 
         # Generate time range based on interval
         if interval == "15m":
-            freq = "15T"
+            freq = "15min"
         elif interval == "30m":
-            freq = "30T"
+            freq = "30min"
         else:
-            freq = "1H"
-
-        dates = pd.date_range(start=start_date, end=end_date, freq=freq)
-
-        # Generate mock price data around $2000
-        base_price = 2000.0
-        price_data = []
+            freq = "1h"
 
-        for i, date in enumerate(dates):
-            # Add some random walk behavior
-            change = np.random.normal(0, 5)  # Random price movement
-            current_price = base_price + change
+        # Cached bounds carry a parsed UTC offset while fresh bounds use the local
+        # zone; pandas refuses mixed tzinfo objects, so align the end to the start
+        if start_date.tzinfo is not None and end_date.tzinfo is not None:
+            end_date = end_date.astimezone(start_date.tzinfo)
 
-            # Create OHLC data
-            open_price = current_price
-            high_price = current_price + abs(np.random.normal(0, 2))
-            low_price = current_price - abs(np.random.normal(0, 2))
-            close_price = current_price + np.random.normal(0, 1)
-            volume = int(np.random.normal(10000, 2000))
-
-            price_data.append({
-                'Datetime': date.strftime('%Y-%m-%d %H:%M:%S%z'),
-                'Open': round(open_price, 2),
-                'High': round(high_price, 2),
-                'Low': round(low_price, 2),
-                'Close': round(close_price, 2),
-                'Volume': max(volume, 1000)  # Ensure positive volume
-            })
-
-            base_price = close_price  # Update base for next iteration
-
-        return pd.DataFrame(price_data)
+        dates = pd.date_range(start=start_date, end=end_date, freq=freq)
+        n = len(dates)
+        rng = np.random.default_rng()
+
+        # Random walk around $2000: each bar opens a random step away from the last close
+        noise = rng.normal(0, 1, n)
+        close = 2000.0 + np.cumsum(rng.normal(0, 5, n) + noise)
+        open_ = close - noise
+        high = np.maximum(open_, close) + np.abs(rng.normal(0, 2, n))
+        low = np.minimum(open_, close) - np.abs(rng.normal(0, 2, n))
+        volume = np.clip(rng.normal(10000, 2000, n).astype(int), 1000, None)  # Ensure positive volume
+
+        return pd.DataFrame({
+            'Open': open_.round(2),
+            'High': high.round(2),
+            'Low': low.round(2),
+            'Close': close.round(2),
+            'Volume': volume
+        }, index=dates.rename('Datetime'))
 
     def save_to_database(self, data: pd.DataFrame, interval: str):
         """Save fetched data to SQLite database."""
@@ -243,41 +299,38 @@ class GoldPriceFetcher:
         current_time = datetime.now().isoformat()
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                # Prepare data for insertion
-                records = []
-                for _, row in data.iterrows():
-                    records.append((
-                        row['Datetime'],
-                        row['Open'],
-                        row['High'],
-                        row['Low'],
-                        row['Close'],
-                        row['Volume'],
-                        current_time
-                    ))
-
-                cursor = conn.cursor()
-                cursor.executemany(f'''
+            with self._conn as conn:
+                # Stream rows straight from the column arrays; tolist yields plain
+                # Python scalars without building an intermediate frame
+                records = zip(
+                    _format_datetimes(data.index).tolist(),
+                    *(data[column].tolist() for column in ('Open', 'High', 'Low', 'Close', 'Volume')),
+                    repeat(current_time)
+                )
+
+                conn.executemany(f'''
                     INSERT OR REPLACE INTO {table_name}
                     (datetime, open, high, low, close, volume, created_at)
                     VALUES (?, ?, ?, ?, ?, ?, ?)
                 ''', records)
 
-                conn.commit()
-                logger.info(f"Saved {len(records)} records to {table_name}")
+                logger.info(f"Saved {len(data)} records to {table_name}")
 
         except sqlite3.Error as e:
             logger.error(f"Error saving to database: {e}")
+        finally:
+            self._range_cache.pop(interval, None)
 
     def get_cached_data(self, interval: str, days: int = 14) -> pd.DataFrame:
         """Retrieve cached data from database."""
+        import pandas as pd
+
         table_name = f"gold_prices_{interval}"
         end_date = datetime.now()
         start_date = end_date - timedelta(days=days)
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn as conn:
                 query = f'''
                     SELECT datetime, open, high, low, close, volume
                     FROM {table_name}
@@ -317,6 +370,8 @@ class GoldPriceFetcher:
 
         intervals = ["15m", "30m"]
 
+        tasks = []
+
         for interval in intervals:
             logger.info(f"\n--- Processing {interval} interval ---")
 
@@ -327,11 +382,57 @@ class GoldPriceFetcher:
                 logger.info(f"All {interval} data is already cached")
                 continue
 
-            # Fetch missing data
-            for missing_start, missing_end in missing_ranges:
-                data = self.fetch_gold_data(missing_start, missing_end, interval)
+            # Gaps on both sides of the cache: one request over the whole window costs
+            # one round trip and rate-limit delay instead of two; overlap is upserted
+            if len(missing_ranges) > 1:
+                missing_ranges = [(missing_ranges[0][0], missing_ranges[-1][1])]
+
+            tasks.extend((interval, missing_start, missing_end) for missing_start, missing_end in missing_ranges)
+
+        if not tasks:
+            return
+
+        # The downloads are independent network waits, so overlap them; saving stays
+        # on this thread so the shared connection only ever has one writer
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {
+                executor.submit(self.fetch_gold_data, missing_start, missing_end, interval): interval
+                for interval, missing_start, missing_end in tasks
+            }
+            for future in as_completed(futures):
+                data = future.result()
                 if data is not None:
-                    self.save_to_database(data, interval)
+                    self.save_to_database(data, futures[future])
+
+    def _summary_stats(self, interval: str, days: int = 14) -> tuple:
+        """Return (count, earliest, latest, latest close) over get_cached_data's window."""
+        import pandas as pd
+
+        table_name = f"gold_prices_{interval}"
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=days)
+
+        try:
+            with self._conn as conn:
+                # Aggregates only, so the summary never materializes the rows themselves
+                row = conn.execute(f'''
+                    SELECT COUNT(*), MIN(datetime), MAX(datetime),
+                           (SELECT close FROM {table_name}
+                            WHERE datetime >= :start AND datetime <= :end
+                            ORDER BY datetime DESC LIMIT 1)
+                    FROM {table_name}
+                    WHERE datetime >= :start AND datetime <= :end
+                ''', {'start': start_date.isoformat(), 'end': end_date.isoformat()}).fetchone()
+
+        except sqlite3.Error as e:
+            logger.error(f"Error summarizing cached data: {e}")
+            return 0, None, None, None
+
+        count, earliest, latest, close = row
+        if not count:
+            return 0, None, None, None
+        return (count, pd.to_datetime(earliest, format='ISO8601', utc=True),
+                pd.to_datetime(latest, format='ISO8601', utc=True), close)
 
     def display_summary(self):
         """Display a summary of cached data."""
@@ -340,14 +441,9 @@ class GoldPriceFetcher:
         print("="*60)
 
         for interval in ["15m", "30m"]:
-            cached_data = self.get_cached_data(interval)
-
-            if not cached_data.empty:
-                latest_price = cached_data.iloc[-1]['close']
-                earliest_date = cached_data.iloc[0]['datetime']
-                latest_date = cached_data.iloc[-1]['datetime']
-                record_count = len(cached_data)
+            record_count, earliest_date, latest_date, latest_price = self._summary_stats(interval)
 
+            if record_count:
                 print(f"\n{interval.upper()} INTERVAL DATA:")
                 print(f"  Records: {record_count}")
                 print(f"  Date range: {earliest_date} to {latest_date}")
@@ -356,8 +452,39 @@ class GoldPriceFetcher:
                 print(f"\n{interval.upper()} INTERVAL DATA: No data available")
 
 
+def run(days: Optional[int] = None, analyze: bool = False, skip_fetch: bool = False,
+        fetcher: Optional[GoldPriceFetcher] = None) -> GoldPriceFetcher:
+    """Fetch and cache gold prices, optionally followed by a trading analysis.
+
+    Pass an existing fetcher to reuse it; the fetcher used is returned.
+    """
+    fetcher = fetcher or GoldPriceFetcher()
+
+    if not skip_fetch:
+        fetcher.fetch_and_cache_gold_prices(days=days)
+        fetcher.display_summary()
+
+    if analyze:
+        try:
+            from trading_analyzer import TradingAnalyzer
+            logger.info("Running trading analysis...")
+            analyzer = TradingAnalyzer()
+            recommendation = analyzer.get_trading_recommendation()
+            analyzer.display_recommendation(recommendation)
+            analyzer.save_recommendation(recommendation)
+        except ImportError as e:
+            logger.error(f"Could not import trading analyzer: {e}")
+            logger.info("Make sure trading_analyzer.py is in the same directory")
+        except Exception as e:
+            logger.error(f"Error running trading analysis: {e}")
+
+    return fetcher
+
+
 def main():
     """Main function to run the gold price fetcher."""
+    config.init()
+
     parser = argparse.ArgumentParser(description='Gold Price Fetcher and Trading Analyzer')
     parser.add_argument('--analyze', '-a', action='store_true',
                        help='Run trading analysis after fetching prices')
@@ -375,26 +502,7 @@ def main():
         return
 
     try:
-        fetcher = GoldPriceFetcher()
-
-        if not args.skip_fetch:
-            fetcher.fetch_and_cache_gold_prices(days=args.days)
-            fetcher.display_summary()
-
-        if args.analyze:
-            try:
-                from trading_analyzer import TradingAnalyzer
-                logger.info("Running trading analysis...")
-                analyzer = TradingAnalyzer()
-                recommendation = analyzer.get_trading_recommendation()
-                analyzer.display_recommendation(recommendation)
-                analyzer.save_recommendation(recommendation)
-            except ImportError as e:
-                logger.error(f"Could not import trading analyzer: {e}")
-                logger.info("Make sure trading_analyzer.py is in the same directory")
-            except Exception as e:
-                logger.error(f"Error running trading analysis: {e}")
-
+        run(days=args.days, analyze=args.analyze, skip_fetch=args.skip_fetch)
     except KeyboardInterrupt:
         logger.info("Process interrupted by user")
     except Exception as e:
@@ -9,6 +9,7 @@ import sqlite3
 import pandas as pd
 from datetime import datetime, timedelta
 import logging
+import sys
 import json
 from typing import Dict, List, Optional, Any, Tuple
 import numpy as np
@@ -466,8 +467,96 @@ class GoldNewsAnalyzer:
         return formatted_news
 
 
+def run(sentiment: bool = False, categories: bool = False, keywords: bool = False,
+        publishers: bool = False, trading_summary: bool = False, days: int = 7,
+        analyzer: Optional[GoldNewsAnalyzer] = None) -> GoldNewsAnalyzer:
+    """Print the requested news analyses (trading summary by default).
+
+    Pass an existing analyzer to reuse it; the analyzer used is returned.
+    """
+    analyzer = analyzer or GoldNewsAnalyzer()
+
+    if sentiment:
+        print("📊 SENTIMENT TREND ANALYSIS")
+        print("=" * 50)
+        trend = analyzer.get_sentiment_trend(days)
+        if 'error' not in trend:
+            print(f"Current Sentiment: {trend['current_sentiment']}")
+            print(f"Trend Direction: {trend['trend_direction']}")
+            print(f"Average Sentiment: {trend['summary']['avg_sentiment']}")
+            print(f"Volatility: {trend['summary']['volatility']}")
+            print(f"Total Articles: {trend['summary']['total_articles']}")
+
+    if categories:
+        print("\n📂 CATEGORY ANALYSIS")
+        print("=" * 50)
+        by_category = analyzer.get_category_analysis(days)
+        if 'error' not in by_category:
+            for cat, data in by_category['categories'].items():
+                print(f"{cat.replace('_', ' ').title()}:")
+                print(f"  Articles: {data['article_count']}")
+                print(f"  Avg Sentiment: {data['avg_sentiment']}")
+                print(f"  Market Impact: {data['market_impact']}")
+
+    if keywords:
+        print("\n🔍 KEYWORD ANALYSIS")
+        print("=" * 50)
+        by_keyword = analyzer.get_keyword_analysis(days)
+        if 'error' not in by_keyword:
+            for keyword, data in by_keyword['top_keywords'].items():
+                print(f"'{keyword}': {data['count']} mentions, sentiment: {data['avg_sentiment']}, signal: {data['market_signal']}")
+
+    if publishers:
+        print("\n📰 PUBLISHER ANALYSIS")
+        print("=" * 50)
+        by_publisher = analyzer.get_publisher_analysis(days)
+        if 'error' not in by_publisher:
+            for pub, data in by_publisher['publishers'].items():
+                print(f"{pub}: {data['article_count']} articles, sentiment: {data['avg_sentiment']} ({data['bias']})")
+
+    if trading_summary:
+        print("\n💰 TRADING SUMMARY")
+        print("=" * 50)
+        summary = analyzer.generate_news_summary_for_trading(3)
+        if 'error' not in summary:
+            print(f"Overall Assessment: {summary['overall_assessment'].upper()}")
+            print(f"Sentiment: {summary['overall_sentiment']:.3f} ({summary['sentiment_trend']})")
+            print(f"News Volume: {summary['news_volume']} articles")
+
+            if summary['key_factors']:
+                print("\nKey Factors:")
+                for factor in summary['key_factors']:
+                    print(f"  - {factor['category']}: {factor['sentiment']:.2f} ({factor['impact']} impact)")
+
+            if summary['market_signals']:
+                print("\nMarket Signals:")
+                for signal in summary['market_signals']:
+                    print(f"  - {signal}")
+
+    # Default: show trading summary if no specific analysis requested
+    if not any([sentiment, categories, keywords, publishers, trading_summary]):
+        print("💰 GOLD NEWS TRADING SUMMARY")
+        print("=" * 60)
+        summary = analyzer.generate_news_summary_for_trading(3)
+        if 'error' not in summary:
+            print(f"📊 Overall Assessment: {summary['overall_assessment'].upper()}")
+            print(f"📈 Current Sentiment: {summary['overall_sentiment']:.3f}")
+            print(f"📰 News Volume: {summary['news_volume']} articles (last 3 days)")
+
+            if summary['market_signals']:
+                print(f"\n🚨 Market Signals:")
+                for signal in summary['market_signals']:
+                    print(f"   • {signal}")
+        else:
+            print("❌ Error: Insufficient news data available")
+
+    return analyzer
+
+
 def main():
     """Main function for news analysis."""
+    config.init()
+
     import argparse
 
     parser = argparse.ArgumentParser(description='Gold News Analysis Tool')
@@ -487,82 +576,8 @@ def main():
     args = parser.parse_args()
 
     try:
-        analyzer = GoldNewsAnalyzer()
-
-        if args.sentiment:
-            print("📊 SENTIMENT TREND ANALYSIS")
-            print("=" * 50)
-            sentiment = analyzer.get_sentiment_trend(args.days)
-            if 'error' not in sentiment:
-                print(f"Current Sentiment: {sentiment['current_sentiment']}")
-                print(f"Trend Direction: {sentiment['trend_direction']}")
-                print(f"Average Sentiment: {sentiment['summary']['avg_sentiment']}")
-                print(f"Volatility: {sentiment['summary']['volatility']}")
-                print(f"Total Articles: {sentiment['summary']['total_articles']}")
-
-        if args.categories:
-            print("\n📂 CATEGORY ANALYSIS")
-            print("=" * 50)
-            categories = analyzer.get_category_analysis(args.days)
-            if 'error' not in categories:
-                for cat, data in categories['categories'].items():
-                    print(f"{cat.replace('_', ' ').title()}:")
-                    print(f"  Articles: {data['article_count']}")
-                    print(f"  Avg Sentiment: {data['avg_sentiment']}")
-                    print(f"  Market Impact: {data['market_impact']}")
-
-        if args.keywords:
-            print("\n🔍 KEYWORD ANALYSIS")
-            print("=" * 50)
-            keywords = analyzer.get_keyword_analysis(args.days)
-            if 'error' not in keywords:
-                for keyword, data in keywords['top_keywords'].items():
-                    print(f"'{keyword}': {data['count']} mentions, sentiment: {data['avg_sentiment']}, signal: {data['market_signal']}")
-
-        if args.publishers:
-            print("\n📰 PUBLISHER ANALYSIS")
-            print("=" * 50)
-            publishers = analyzer.get_publisher_analysis(args.days)
-            if 'error' not in publishers:
-                for pub, data in publishers['publishers'].items():
-                    print(f"{pub}: {data['article_count']} articles, sentiment: {data['avg_sentiment']} ({data['bias']})")
-
-        if args.trading_summary:
-            print("\n💰 TRADING SUMMARY")
-            print("=" * 50)
-            summary = analyzer.generate_news_summary_for_trading(3)
-            if 'error' not in summary:
-                print(f"Overall Assessment: {summary['overall_assessment'].upper()}")
-                print(f"Sentiment: {summary['overall_sentiment']:.3f} ({summary['sentiment_trend']})")
-                print(f"News Volume: {summary['news_volume']} articles")
-
-                if summary['key_factors']:
-                    print("\nKey Factors:")
-                    for factor in summary['key_factors']:
-                        print(f"  - {factor['category']}: {factor['sentiment']:.2f} ({factor['impact']} impact)")
-
-                if summary['market_signals']:
-                    print("\nMarket Signals:")
-                    for signal in summary['market_signals']:
-                        print(f"  - {signal}")
-
-        # Default: show trading summary if no specific analysis requested
-        if not any([args.sentiment, args.categories, args.keywords, args.publishers, args.trading_summary]):
-            print("💰 GOLD NEWS TRADING SUMMARY")
-            print("=" * 60)
-            summary = analyzer.generate_news_summary_for_trading(3)
-            if 'error' not in summary:
-                print(f"📊 Overall Assessment: {summary['overall_assessment'].upper()}")
-                print(f"📈 Current Sentiment: {summary['overall_sentiment']:.3f}")
-                print(f"📰 News Volume: {summary['news_volume']} articles (last 3 days)")
-
-                if summary['market_signals']:
-                    print(f"\n🚨 Market Signals:")
-                    for signal in summary['market_signals']:
-                        print(f"   • {signal}")
-            else:
-                print("❌ Error: Insufficient news data available")
-
+        run(sentiment=args.sentiment, categories=args.categories, keywords=args.keywords,
+            publishers=args.publishers, trading_summary=args.trading_summary, days=args.days)
     except Exception as e:
         logger.error(f"Error in news analysis: {e}")
         sys.exit(1)
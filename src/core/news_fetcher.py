@@ -5,33 +5,163 @@ Fetches gold-related news articles and intelligently caches them in SQLite to av
 """
 
 import sqlite3
-import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
 import logging
 import sys
+import threading
 import hashlib
 import json
-from typing import Optional, Dict, List, Any
+import re
+from typing import Optional, Dict, List, Any, Iterable, Iterator, Set, Tuple
 import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from itertools import chain
 from config import get_config
 
 # Get configuration
 config = get_config()
 logger = logging.getLogger(__name__)
 
+# Applied to the fetcher's connection; journal_mode is persistent and set once in init_database
+_PRAGMAS = (
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA busy_timeout=3000',
+)
+
+_GOLD_KEYWORDS = (
+    'gold', 'precious metals', 'bullion', 'mining', 'fed', 'inflation',
+    'dollar', 'economy', 'market', 'price', 'trading', 'investment',
+    'central bank', 'interest rates', 'commodity', 'futures'
+)
+
+# Checked in order; the first category with a matching trigger wins
+_CATEGORY_TRIGGERS = (
+    ('monetary_policy', frozenset({'fed', 'federal reserve', 'interest rate', 'monetary policy'})),
+    ('supply_demand', frozenset({'mining', 'production', 'supply'})),
+    ('market_movement', frozenset({'trading', 'price', 'market', 'rally', 'drop'})),
+    ('geopolitical', frozenset({'geopolitical', 'war', 'crisis', 'tension'})),
+    ('economic_data', frozenset({'economic', 'gdp', 'employment', 'inflation'})),
+)
+
+_POSITIVE_WORDS = frozenset({
+    'surge', 'rally', 'rise', 'gain', 'up', 'bullish', 'strong', 'high',
+    'increase', 'boost', 'positive', 'optimistic', 'buy', 'support'
+})
+
+_NEGATIVE_WORDS = frozenset({
+    'fall', 'drop', 'decline', 'down', 'bearish', 'weak', 'low',
+    'decrease', 'crash', 'negative', 'pessimistic', 'sell', 'pressure'
+})
+
+_TERMS = {*_GOLD_KEYWORDS, *_POSITIVE_WORDS, *_NEGATIVE_WORDS,
+          *(word for _, words in _CATEGORY_TRIGGERS for word in words)}
+
+# One scan finds every term starting at a word boundary (the lookahead lets
+# matches overlap); longest alternatives are tried first
+_TERM_PATTERN = re.compile(
+    r'\b(?=(' + '|'.join(map(re.escape, sorted(_TERMS, key=len, reverse=True))) + '))'
+)
+
+# A matched term also counts as every shorter term it starts with ('federal' -> 'fed')
+_IMPLIED_TERMS = {term: {other for other in _TERMS if term.startswith(other)} for term in _TERMS}
+
+# External-content full-text index over the searchable columns, kept in sync by triggers
+_FTS_TABLE_DDL = '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS gold_news_fts
+    USING fts5(title, summary, keywords, content='gold_news', content_rowid='id')
+'''
+
+_FTS_TRIGGERS_DDL = (
+    '''
+    CREATE TRIGGER IF NOT EXISTS gold_news_fts_ai AFTER INSERT ON gold_news BEGIN
+        INSERT INTO gold_news_fts(rowid, title, summary, keywords)
+        VALUES (new.id, new.title, new.summary, new.keywords);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS gold_news_fts_ad AFTER DELETE ON gold_news BEGIN
+        INSERT INTO gold_news_fts(gold_news_fts, rowid, title, summary, keywords)
+        VALUES ('delete', old.id, old.title, old.summary, old.keywords);
+    END
+    ''',
+    '''
+    CREATE TRIGGER IF NOT EXISTS gold_news_fts_au AFTER UPDATE ON gold_news BEGIN
+        INSERT INTO gold_news_fts(gold_news_fts, rowid, title, summary, keywords)
+        VALUES ('delete', old.id, old.title, old.summary, old.keywords);
+        INSERT INTO gold_news_fts(rowid, title, summary, keywords)
+        VALUES (new.id, new.title, new.summary, new.keywords);
+    END
+    ''',
+)
+
+_INSERT_NEWS_SQL = '''
+    INSERT OR IGNORE INTO gold_news
+    (title, summary, link, publisher, published_date, symbol,
+     content_hash, sentiment_score, keywords, category, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_FETCH_HISTORY_SQL = '''
+    INSERT INTO news_fetch_history
+    (symbol, fetch_date, articles_count, success, error_message, created_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+
+def _fts_query(keyword: str) -> str:
+    """Quote a search keyword as an FTS5 phrase whose last word may be a prefix."""
+    return '"' + keyword.replace('"', '""') + '"*'
+
+
+def _match_terms(text: str) -> Set[str]:
+    """Return every known term that starts a word in lowercased text."""
+    terms = set()
+    for match in _TERM_PATTERN.finditer(text):
+        terms |= _IMPLIED_TERMS[match.group(1)]
+    return terms
+
 
 class GoldNewsFetcher:
     def __init__(self, db_path: Optional[str] = None):
         """Initialize the gold news fetcher with SQLite database."""
         self.db_path = db_path or config.database_path
         self.symbols = config.news_symbols  # Use configured news symbols
+        self._known_hashes = None  # Stored content hashes, loaded on first save
+        self._fts_enabled = False  # Set by init_database when SQLite has FTS5
+        # One connection for the fetcher's lifetime keeps its prepared statements warm;
+        # the lock stops threads sharing a fetcher (e.g. web requests) interleaving transactions
+        self._lock = threading.Lock()
+        self._conn = self._open_connection()
         self.init_database()
 
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open the fetcher's long-lived connection with tuned settings."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    @contextmanager
+    def _connect(self):
+        """Hold the shared connection for one transaction, committing on success."""
+        with self._lock, self._conn:
+            yield self._conn
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
     def init_database(self):
         """Initialize the SQLite database with required tables."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
+                conn.execute('PRAGMA journal_mode=WAL')
                 cursor = conn.cursor()
 
                 # Create table for news articles
@@ -44,7 +174,7 @@ class GoldNewsFetcher:
                         publisher TEXT,
                         published_date TEXT,
                         symbol TEXT,
-                        content_hash TEXT UNIQUE,
+                        content_hash BLOB UNIQUE,
                         sentiment_score REAL,
                         keywords TEXT,
                         category TEXT,
@@ -59,16 +189,44 @@ class GoldNewsFetcher:
                     ON gold_news(published_date)
                 ''')
 
+                # Filtered reads narrow on category/symbol and then walk the date in order
+                has_composite = cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'idx_cat_date'"
+                ).fetchone()
+
                 cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_symbol
-                    ON gold_news(symbol)
+                    CREATE INDEX IF NOT EXISTS idx_cat_date
+                    ON gold_news(category, published_date)
                 ''')
 
                 cursor.execute('''
-                    CREATE INDEX IF NOT EXISTS idx_keywords
-                    ON gold_news(keywords)
+                    CREATE INDEX IF NOT EXISTS idx_sym_date
+                    ON gold_news(symbol, published_date)
                 ''')
 
+                # idx_symbol is a prefix of idx_sym_date; idx_keywords never served the
+                # '%...%' search and only slowed down inserts
+                cursor.execute('DROP INDEX IF EXISTS idx_symbol')
+                cursor.execute('DROP INDEX IF EXISTS idx_keywords')
+
+                if not has_composite:
+                    # Give the planner statistics to choose between the date indexes
+                    cursor.execute('ANALYZE gold_news')
+
+                # Full-text search index; existing rows are indexed when it is first created
+                has_fts = cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE name = 'gold_news_fts'"
+                ).fetchone()
+                try:
+                    cursor.execute(_FTS_TABLE_DDL)
+                    for ddl in _FTS_TRIGGERS_DDL:
+                        cursor.execute(ddl)
+                    if not has_fts:
+                        cursor.execute("INSERT INTO gold_news_fts(gold_news_fts) VALUES ('rebuild')")
+                    self._fts_enabled = True
+                except sqlite3.OperationalError as e:
+                    logger.warning(f"Full-text search unavailable, falling back to LIKE: {e}")
+
                 # Create table for news fetch history
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS news_fetch_history (
@@ -89,65 +247,45 @@ class GoldNewsFetcher:
             logger.error(f"Database initialization error: {e}")
             sys.exit(1)
 
-    def _generate_content_hash(self, title: str, summary: str, link: str) -> str:
+    def _generate_content_hash(self, title: str, summary: str, link: str) -> bytes:
         """Generate a unique hash for news content to avoid duplicates."""
+        # Stored as the raw 16-byte digest: half the size of hex text in the UNIQUE index.
+        # Dedup only, so the faster BLAKE2b truncated to MD5's width is used instead of MD5
         content = f"{title}{summary}{link}".encode('utf-8')
-        return hashlib.md5(content).hexdigest()
+        return hashlib.blake2b(content, digest_size=16).digest()
+
+    def _analyze_content(self, title: str, summary: str) -> Tuple[List[str], str, float]:
+        """Extract keywords, category and sentiment from a single scan of the text."""
+        text = f"{title} {summary}".lower()
+        terms = _match_terms(text)
+        return (self._extract_keywords(terms),
+                self._categorize_news(terms),
+                self._calculate_sentiment_score(text, terms))
 
-    def _extract_keywords(self, title: str, summary: str) -> List[str]:
-        """Extract relevant keywords from news content."""
+    def _extract_keywords(self, terms: Set[str]) -> List[str]:
+        """Extract relevant keywords from the matched terms."""
         if not config.auto_categorize_news:
             return []
 
-        gold_keywords = [
-            'gold', 'precious metals', 'bullion', 'mining', 'fed', 'inflation',
-            'dollar', 'economy', 'market', 'price', 'trading', 'investment',
-            'central bank', 'interest rates', 'commodity', 'futures'
-        ]
-
-        text = f"{title} {summary}".lower()
-        found_keywords = [keyword for keyword in gold_keywords if keyword in text]
-        return found_keywords
+        return [keyword for keyword in _GOLD_KEYWORDS if keyword in terms]
 
-    def _categorize_news(self, title: str, summary: str) -> str:
-        """Categorize news article based on content."""
+    def _categorize_news(self, terms: Set[str]) -> str:
+        """Categorize news article based on the matched terms."""
         if not config.auto_categorize_news:
             return 'general'
 
-        text = f"{title} {summary}".lower()
-
-        if any(word in text for word in ['fed', 'federal reserve', 'interest rate', 'monetary policy']):
-            return 'monetary_policy'
-        elif any(word in text for word in ['mining', 'production', 'supply']):
-            return 'supply_demand'
-        elif any(word in text for word in ['trading', 'price', 'market', 'rally', 'drop']):
-            return 'market_movement'
-        elif any(word in text for word in ['geopolitical', 'war', 'crisis', 'tension']):
-            return 'geopolitical'
-        elif any(word in text for word in ['economic', 'gdp', 'employment', 'inflation']):
-            return 'economic_data'
-        else:
-            return 'general'
+        for category, words in _CATEGORY_TRIGGERS:
+            if not words.isdisjoint(terms):
+                return category
+        return 'general'
 
-    def _calculate_sentiment_score(self, title: str, summary: str) -> float:
+    def _calculate_sentiment_score(self, text: str, terms: Set[str]) -> float:
         """Simple sentiment analysis based on keyword matching."""
         if not config.enable_sentiment_analysis:
             return 0.0
 
-        text = f"{title} {summary}".lower()
-
-        positive_words = [
-            'surge', 'rally', 'rise', 'gain', 'up', 'bullish', 'strong', 'high',
-            'increase', 'boost', 'positive', 'optimistic', 'buy', 'support'
-        ]
-
-        negative_words = [
-            'fall', 'drop', 'decline', 'down', 'bearish', 'weak', 'low',
-            'decrease', 'crash', 'negative', 'pessimistic', 'sell', 'pressure'
-        ]
-
-        positive_count = sum(1 for word in positive_words if word in text)
-        negative_count = sum(1 for word in negative_words if word in text)
+        positive_count = len(_POSITIVE_WORDS & terms)
+        negative_count = len(_NEGATIVE_WORDS & terms)
 
         total_words = len(text.split())
         if total_words == 0:
@@ -170,6 +308,10 @@ class GoldNewsFetcher:
             if config.api_delay > 0:
                 time.sleep(config.api_delay)
 
+            # Imported here so cache-only readers never load yfinance. A fresh Ticker per
+            # call is deliberate: Ticker.news memoizes its first result, and yfinance
+            # already reuses one HTTP session process-wide
+            import yfinance as yf
             ticker = yf.Ticker(symbol)
             news_data = ticker.news
 
@@ -177,73 +319,7 @@ class GoldNewsFetcher:
                 logger.warning(f"No news found for symbol: {symbol}")
                 return []
 
-            processed_news = []
-            for article in news_data[:max_articles]:
-                try:
-                    # Extract article data from nested content structure
-                    content = article.get('content', article)  # Handle both old and new formats
-                    title = content.get('title', 'No Title')
-                    summary = content.get('summary', content.get('description', ''))
-
-                    # Get link from different possible locations
-                    if 'clickThroughUrl' in content and content['clickThroughUrl']:
-                        link = content['clickThroughUrl'].get('url', '')
-                    elif 'canonicalUrl' in content and content['canonicalUrl']:
-                        link = content['canonicalUrl'].get('url', '')
-                    else:
-                        link = content.get('link', '')
-
-                    # Get publisher
-                    if 'provider' in content and content['provider']:
-                        publisher = content['provider'].get('displayName', 'Unknown')
-                    else:
-                        publisher = content.get('publisher', 'Unknown')
-
-                    # Convert timestamp to datetime - handle different timestamp formats
-                    published_timestamp = None
-                    if 'pubDate' in content:
-                        # Handle ISO format timestamp
-                        try:
-                            pub_date_str = content['pubDate']
-                            if pub_date_str.endswith('Z'):
-                                pub_date_str = pub_date_str[:-1] + '+00:00'
-                            published_date = datetime.fromisoformat(pub_date_str).isoformat()
-                        except:
-                            published_date = datetime.now().isoformat()
-                    elif 'providerPublishTime' in content:
-                        # Handle Unix timestamp
-                        published_timestamp = content.get('providerPublishTime', 0)
-                        published_date = datetime.fromtimestamp(published_timestamp).isoformat() if published_timestamp else datetime.now().isoformat()
-                    else:
-                        published_date = datetime.now().isoformat()
-
-                    # Generate content hash
-                    content_hash = self._generate_content_hash(title, summary, link)
-
-                    # Extract additional metadata
-                    keywords = self._extract_keywords(title, summary)
-                    category = self._categorize_news(title, summary)
-                    sentiment_score = self._calculate_sentiment_score(title, summary)
-
-                    processed_article = {
-                        'title': title,
-                        'summary': summary,
-                        'link': link,
-                        'publisher': publisher,
-                        'published_date': published_date,
-                        'symbol': symbol,
-                        'content_hash': content_hash,
-                        'sentiment_score': sentiment_score,
-                        'keywords': json.dumps(keywords),
-                        'category': category
-                    }
-
-                    processed_news.append(processed_article)
-
-                except Exception as e:
-                    logger.warning(f"Error processing article: {e}")
-                    continue
-
+            processed_news = list(self._iter_processed_articles(news_data[:max_articles], symbol))
             logger.info(f"Processed {len(processed_news)} articles for {symbol}")
             return processed_news
 
@@ -251,6 +327,71 @@ class GoldNewsFetcher:
             logger.error(f"Error fetching news for {symbol}: {e}")
             return []
 
+    def _iter_processed_articles(self, news_data: Iterable[Dict[str, Any]],
+                                 symbol: str) -> Iterator[Dict[str, Any]]:
+        """Yield yfinance news items as processed articles, skipping malformed ones."""
+        for article in news_data:
+            try:
+                # Extract article data from nested content structure
+                content = article.get('content', article)  # Handle both old and new formats
+                title = content.get('title', 'No Title')
+                summary = content.get('summary', content.get('description', ''))
+
+                # Get link from different possible locations
+                if 'clickThroughUrl' in content and content['clickThroughUrl']:
+                    link = content['clickThroughUrl'].get('url', '')
+                elif 'canonicalUrl' in content and content['canonicalUrl']:
+                    link = content['canonicalUrl'].get('url', '')
+                else:
+                    link = content.get('link', '')
+
+                # Get publisher
+                if 'provider' in content and content['provider']:
+                    publisher = content['provider'].get('displayName', 'Unknown')
+                else:
+                    publisher = content.get('publisher', 'Unknown')
+
+                # Convert timestamp to datetime - handle different timestamp formats
+                published_timestamp = None
+                if 'pubDate' in content:
+                    # Handle ISO format timestamp
+                    try:
+                        pub_date_str = content['pubDate']
+                        if pub_date_str.endswith('Z'):
+                            pub_date_str = pub_date_str[:-1] + '+00:00'
+                        published_date = datetime.fromisoformat(pub_date_str).isoformat()
+                    except:
+                        published_date = datetime.now().isoformat()
+                elif 'providerPublishTime' in content:
+                    # Handle Unix timestamp
+                    published_timestamp = content.get('providerPublishTime', 0)
+                    published_date = datetime.fromtimestamp(published_timestamp).isoformat() if published_timestamp else datetime.now().isoformat()
+                else:
+                    published_date = datetime.now().isoformat()
+
+                # Generate content hash
+                content_hash = self._generate_content_hash(title, summary, link)
+
+                # Extract additional metadata
+                keywords, category, sentiment_score = self._analyze_content(title, summary)
+
+                yield {
+                    'title': title,
+                    'summary': summary,
+                    'link': link,
+                    'publisher': publisher,
+                    'published_date': published_date,
+                    'symbol': symbol,
+                    'content_hash': content_hash,
+                    'sentiment_score': sentiment_score,
+                    'keywords': keywords,
+                    'category': category
+                }
+
+            except Exception as e:
+                logger.warning(f"Error processing article: {e}")
+                continue
+
     def _get_mock_news(self, symbol: str, max_articles: int) -> List[Dict[str, Any]]:
         """Generate mock news data for testing."""
         import random
@@ -289,9 +430,7 @@ class GoldNewsFetcher:
             published_date = (datetime.now() - timedelta(hours=hours_ago)).isoformat()
 
             content_hash = self._generate_content_hash(title, summary, link)
-            keywords = self._extract_keywords(title, summary)
-            category = self._categorize_news(title, summary)
-            sentiment_score = self._calculate_sentiment_score(title, summary)
+            keywords, category, sentiment_score = self._analyze_content(title, summary)
 
             mock_articles.append({
                 'title': title,
@@ -302,54 +441,74 @@ class GoldNewsFetcher:
                 'symbol': symbol,
                 'content_hash': content_hash,
                 'sentiment_score': sentiment_score,
-                'keywords': json.dumps(keywords),
+                'keywords': keywords,
                 'category': category
             })
 
         return mock_articles
 
-    def save_news_to_database(self, news_articles: List[Dict[str, Any]]) -> int:
-        """Save news articles to SQLite database, avoiding duplicates."""
-        if not news_articles:
-            return 0
+    def _load_known_hashes(self) -> Set[bytes]:
+        """Load the content hashes of every stored article."""
+        try:
+            with self._connect() as conn:
+                return {row[0] for row in conn.execute('SELECT content_hash FROM gold_news')}
+        except sqlite3.Error as e:
+            logger.warning(f"Error loading stored content hashes: {e}")
+            return set()
+
+    def save_news_to_database(self, news_articles: Iterable[Dict[str, Any]]) -> int:
+        """Save news articles to SQLite database, avoiding duplicates.
+
+        Accepts any iterable; articles are turned into rows as executemany consumes them.
+        """
+        # Re-polls are mostly articles we already have; skip them before touching SQLite,
+        # which stays the authority through INSERT OR IGNORE
+        if self._known_hashes is None:
+            self._known_hashes = self._load_known_hashes()
 
         saved_count = 0
         current_time = datetime.now().isoformat()
+        attempted_hashes = []
 
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
+        def new_rows():
+            for article in news_articles:
+                content_hash = article['content_hash']
+                if content_hash in self._known_hashes:
+                    continue
+                attempted_hashes.append(content_hash)
+                yield (
+                    article['title'],
+                    article['summary'],
+                    article['link'],
+                    article['publisher'],
+                    article['published_date'],
+                    article['symbol'],
+                    content_hash,
+                    article['sentiment_score'],
+                    # Serialized only for rows that will actually be inserted
+                    json.dumps(article['keywords']),
+                    article['category'],
+                    current_time,
+                    current_time
+                )
+
+        # Peek so a batch of only known articles never opens a write transaction
+        rows = new_rows()
+        first_row = next(rows, None)
+        if first_row is None:
+            logger.info("Saved 0 new articles to database")
+            return 0
 
-                for article in news_articles:
-                    try:
-                        cursor.execute('''
-                            INSERT OR IGNORE INTO gold_news
-                            (title, summary, link, publisher, published_date, symbol,
-                             content_hash, sentiment_score, keywords, category, created_at, updated_at)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ''', (
-                            article['title'],
-                            article['summary'],
-                            article['link'],
-                            article['publisher'],
-                            article['published_date'],
-                            article['symbol'],
-                            article['content_hash'],
-                            article['sentiment_score'],
-                            article['keywords'],
-                            article['category'],
-                            current_time,
-                            current_time
-                        ))
-
-                        if cursor.rowcount > 0:
-                            saved_count += 1
-
-                    except sqlite3.Error as e:
-                        logger.warning(f"Error saving article '{article.get('title', 'Unknown')}': {e}")
+        try:
+            with self._connect() as conn:
+                # Take the write lock up front; the block commits the batch as one transaction
+                conn.execute('BEGIN IMMEDIATE')
+                cursor = conn.executemany(_INSERT_NEWS_SQL, chain((first_row,), rows))
+                # rowcount sums each row's own changes, so FTS trigger writes are not counted
+                saved_count = cursor.rowcount
 
-                conn.commit()
-                logger.info(f"Saved {saved_count} new articles to database")
+            self._known_hashes.update(attempted_hashes)
+            logger.info(f"Saved {saved_count} new articles to database")
 
         except sqlite3.Error as e:
             logger.error(f"Database error while saving news: {e}")
@@ -360,7 +519,7 @@ class GoldNewsFetcher:
                        min_sentiment: Optional[float] = None) -> pd.DataFrame:
         """Retrieve cached news from database with optional filters."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=days)
 
@@ -383,11 +542,12 @@ class GoldNewsFetcher:
 
                 query += ' ORDER BY published_date DESC'
 
-                df = pd.read_sql_query(query, conn, params=params)
+                # Dates are parsed while the frame is built; stored values mix naive and offset ISO strings
+                df = pd.read_sql_query(query, conn, params=params,
+                                       parse_dates={'published_date': {'format': 'ISO8601', 'utc': True}})
 
                 if not df.empty:
-                    df['published_date'] = pd.to_datetime(df['published_date'], format='ISO8601', utc=True)
-                    df['keywords'] = df['keywords'].apply(lambda x: json.loads(x) if x else [])
+                    df['keywords'] = [json.loads(x) if x else [] for x in df['keywords'].tolist()]
 
                 return df
 
@@ -400,30 +560,37 @@ class GoldNewsFetcher:
         max_articles_per_symbol = max_articles_per_symbol or config.max_articles_per_symbol
         logger.info(f"Starting gold news fetch for symbols: {', '.join(self.symbols)}")
 
-        results = {}
+        results = dict.fromkeys(self.symbols, 0)
         total_saved = 0
 
-        for symbol in self.symbols:
-            try:
-                # Fetch news for symbol
-                news_articles = self.fetch_news_for_symbol(symbol, max_articles_per_symbol)
+        if not self.symbols:
+            return results
+
+        # Fetches are independent network waits, so overlap them; saving stays on
+        # this thread so SQLite only ever sees one writer
+        with ThreadPoolExecutor(max_workers=min(8, len(self.symbols))) as executor:
+            futures = {
+                executor.submit(self.fetch_news_for_symbol, symbol, max_articles_per_symbol): symbol
+                for symbol in self.symbols
+            }
 
-                # Save to database
-                saved_count = self.save_news_to_database(news_articles)
-                results[symbol] = saved_count
-                total_saved += saved_count
+            for future in as_completed(futures):
+                symbol = futures[future]
+                try:
+                    news_articles = future.result()
 
-                # Record fetch history
-                self._record_fetch_history(symbol, len(news_articles), True, None)
+                    # Save to database
+                    saved_count = self.save_news_to_database(news_articles)
+                    results[symbol] = saved_count
+                    total_saved += saved_count
 
-                # Rate limiting between symbols
-                if config.api_delay > 0 and symbol != self.symbols[-1]:
-                    time.sleep(config.api_delay)
+                    # Record fetch history
+                    self._record_fetch_history(symbol, len(news_articles), True, None)
 
-            except Exception as e:
-                logger.error(f"Error processing {symbol}: {e}")
-                results[symbol] = 0
-                self._record_fetch_history(symbol, 0, False, str(e))
+                except Exception as e:
+                    logger.error(f"Error processing {symbol}: {e}")
+                    results[symbol] = 0
+                    self._record_fetch_history(symbol, 0, False, str(e))
 
         logger.info(f"News fetch complete. Total new articles saved: {total_saved}")
         return results
@@ -431,13 +598,9 @@ class GoldNewsFetcher:
     def _record_fetch_history(self, symbol: str, articles_count: int, success: bool, error_message: Optional[str]):
         """Record fetch history for monitoring."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO news_fetch_history
-                    (symbol, fetch_date, articles_count, success, error_message, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                ''', (
+                cursor.execute(_INSERT_FETCH_HISTORY_SQL, (
                     symbol,
                     datetime.now().date().isoformat(),
                     articles_count,
@@ -452,48 +615,37 @@ class GoldNewsFetcher:
     def get_news_summary(self, days: int = 7) -> Dict[str, Any]:
         """Get a summary of cached news data."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-
-                # Total articles count
-                cursor.execute('SELECT COUNT(*) FROM gold_news')
-                total_articles = cursor.fetchone()[0]
-
-                # Recent articles (last N days)
+            with self._connect() as conn:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=days)
 
-                cursor.execute('''
-                    SELECT COUNT(*) FROM gold_news
-                    WHERE published_date >= ?
-                ''', (start_date.isoformat(),))
-                recent_articles = cursor.fetchone()[0]
-
-                # Articles by category
-                cursor.execute('''
-                    SELECT category, COUNT(*) FROM gold_news
-                    WHERE published_date >= ?
-                    GROUP BY category
-                    ORDER BY COUNT(*) DESC
-                ''', (start_date.isoformat(),))
-                categories = dict(cursor.fetchall())
-
-                # Average sentiment
-                cursor.execute('''
-                    SELECT AVG(sentiment_score) FROM gold_news
-                    WHERE published_date >= ?
-                ''', (start_date.isoformat(),))
-                avg_sentiment = cursor.fetchone()[0] or 0.0
+                # Total articles count
+                total_articles = conn.execute('SELECT COUNT(*) FROM gold_news').fetchone()[0]
 
-                # Top publishers
-                cursor.execute('''
-                    SELECT publisher, COUNT(*) FROM gold_news
-                    WHERE published_date >= ?
-                    GROUP BY publisher
-                    ORDER BY COUNT(*) DESC
-                    LIMIT 5
-                ''', (start_date.isoformat(),))
-                top_publishers = dict(cursor.fetchall())
+                # One pass over the window; per-category and per-publisher figures are
+                # folded from its (category, publisher) groups
+                rows = conn.execute('''
+                    SELECT category, publisher, COUNT(*),
+                           SUM(sentiment_score), COUNT(sentiment_score)
+                    FROM gold_news
+                    WHERE published_date >= :start
+                    GROUP BY category, publisher
+                ''', {'start': start_date.isoformat()})
+
+                categories = Counter()
+                publishers = Counter()
+                sentiment_total = 0.0
+                sentiment_count = 0
+                for category, publisher, count, group_sentiment, group_scored in rows:
+                    categories[category] += count
+                    publishers[publisher] += count
+                    sentiment_total += group_sentiment or 0.0
+                    sentiment_count += group_scored
+
+                recent_articles = sum(categories.values())
+                avg_sentiment = sentiment_total / sentiment_count if sentiment_count else 0.0
+                categories = dict(categories.most_common())
+                top_publishers = dict(publishers.most_common(5))
 
                 return {
                     'total_articles': total_articles,
@@ -537,7 +689,7 @@ class GoldNewsFetcher:
     def get_recent_headlines(self, limit: int = 10, category: Optional[str] = None) -> List[Dict[str, Any]]:
         """Get recent headlines with optional category filter."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 query = '''
                     SELECT title, summary, published_date, publisher, sentiment_score, category
                     FROM gold_news
@@ -552,20 +704,11 @@ class GoldNewsFetcher:
                 params.append(limit)
 
                 cursor = conn.cursor()
+                # Rows come back keyed by their selected column names
+                cursor.row_factory = sqlite3.Row
                 cursor.execute(query, params)
 
-                results = []
-                for row in cursor.fetchall():
-                    results.append({
-                        'title': row[0],
-                        'summary': row[1],
-                        'published_date': row[2],
-                        'publisher': row[3],
-                        'sentiment_score': row[4],
-                        'category': row[5]
-                    })
-
-                return results
+                return [dict(row) for row in cursor]
 
         except sqlite3.Error as e:
             logger.error(f"Error getting recent headlines: {e}")
@@ -574,48 +717,101 @@ class GoldNewsFetcher:
     def search_news(self, keyword: str, days: int = 30, limit: int = 20) -> List[Dict[str, Any]]:
         """Search news articles by keyword."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=days)
 
-                query = '''
-                    SELECT title, summary, link, published_date, publisher,
-                           sentiment_score, category
-                    FROM gold_news
-                    WHERE (title LIKE ? OR summary LIKE ? OR keywords LIKE ?)
-                    AND published_date >= ?
-                    ORDER BY published_date DESC
-                    LIMIT ?
-                '''
-
-                search_pattern = f'%{keyword}%'
-                params = [search_pattern, search_pattern, search_pattern,
-                         start_date.isoformat(), limit]
+                if self._fts_enabled:
+                    query = '''
+                        SELECT gold_news.title, gold_news.summary, gold_news.link,
+                               gold_news.published_date, gold_news.publisher,
+                               gold_news.sentiment_score, gold_news.category
+                        FROM gold_news_fts
+                        JOIN gold_news ON gold_news.id = gold_news_fts.rowid
+                        WHERE gold_news_fts MATCH ?
+                        AND gold_news.published_date >= ?
+                        ORDER BY gold_news.published_date DESC
+                        LIMIT ?
+                    '''
+                    params = [_fts_query(keyword), start_date.isoformat(), limit]
+                else:
+                    query = '''
+                        SELECT title, summary, link, published_date, publisher,
+                               sentiment_score, category
+                        FROM gold_news
+                        WHERE (title LIKE ? OR summary LIKE ? OR keywords LIKE ?)
+                        AND published_date >= ?
+                        ORDER BY published_date DESC
+                        LIMIT ?
+                    '''
+                    search_pattern = f'%{keyword}%'
+                    params = [search_pattern, search_pattern, search_pattern,
+                              start_date.isoformat(), limit]
 
                 cursor = conn.cursor()
+                # Rows come back keyed by their selected column names
+                cursor.row_factory = sqlite3.Row
                 cursor.execute(query, params)
 
-                results = []
-                for row in cursor.fetchall():
-                    results.append({
-                        'title': row[0],
-                        'summary': row[1],
-                        'link': row[2],
-                        'published_date': row[3],
-                        'publisher': row[4],
-                        'sentiment_score': row[5],
-                        'category': row[6]
-                    })
-
-                return results
+                return [dict(row) for row in cursor]
 
         except sqlite3.Error as e:
             logger.error(f"Error searching news: {e}")
             return []
 
 
+def run(fetch: bool = False, summary: bool = False, search: Optional[str] = None,
+        headlines: int = 0, category: Optional[str] = None,
+        fetcher: Optional[GoldNewsFetcher] = None) -> GoldNewsFetcher:
+    """Fetch, summarize, search or list cached gold news.
+
+    Pass an existing fetcher to reuse it; the fetcher used is returned.
+    """
+    fetcher = fetcher or GoldNewsFetcher()
+
+    if fetch:
+        # Fetch and cache news
+        results = fetcher.fetch_and_cache_gold_news()
+        print(f"\n📰 News Fetch Results:")
+        for symbol, count in results.items():
+            print(f"   • {symbol}: {count} new articles")
+
+    if summary:
+        # Display summary
+        fetcher.display_news_summary()
+
+    if search:
+        # Search functionality
+        results = fetcher.search_news(search)
+        print(f"\n🔍 Search Results for '{search}' ({len(results)} articles):")
+        for article in results:
+            sentiment_emoji = "📈" if article['sentiment_score'] > 0.1 else "📉" if article['sentiment_score'] < -0.1 else "📊"
+            print(f"   {sentiment_emoji} {article['title']} [{article['publisher']}]")
+            if article['summary']:
+                print(f"      {article['summary'][:150]}...")
+
+    if headlines:
+        # Show recent headlines
+        recent = fetcher.get_recent_headlines(headlines, category)
+        category_text = f" ({category.replace('_', ' ').title()})" if category else ""
+        print(f"\n📰 Recent Gold Headlines{category_text}:")
+        for i, article in enumerate(recent, 1):
+            sentiment_emoji = "📈" if article['sentiment_score'] > 0.1 else "📉" if article['sentiment_score'] < -0.1 else "📊"
+            date_str = article['published_date'][:19] if article['published_date'] else 'Unknown'
+            print(f"   {i}. {sentiment_emoji} {article['title']}")
+            print(f"      {article['publisher']} | {date_str} | Sentiment: {article['sentiment_score']:.2f}")
+
+    # Default behavior: show summary if no specific action
+    if not any([fetch, summary, search, headlines]):
+        fetcher.display_news_summary()
+
+    return fetcher
+
+
 def main():
     """Main function to run the gold news fetcher."""
+    config.init()
+
     import argparse
 
     parser = argparse.ArgumentParser(description='Gold News Fetcher and Cache Manager')
@@ -640,44 +836,8 @@ def main():
         return
 
     try:
-        fetcher = GoldNewsFetcher()
-
-        if args.fetch:
-            # Fetch and cache news
-            results = fetcher.fetch_and_cache_gold_news()
-            print(f"\n📰 News Fetch Results:")
-            for symbol, count in results.items():
-                print(f"   • {symbol}: {count} new articles")
-
-        if args.summary:
-            # Display summary
-            fetcher.display_news_summary()
-
-        if args.search:
-            # Search functionality
-            results = fetcher.search_news(args.search)
-            print(f"\n🔍 Search Results for '{args.search}' ({len(results)} articles):")
-            for article in results:
-                sentiment_emoji = "📈" if article['sentiment_score'] > 0.1 else "📉" if article['sentiment_score'] < -0.1 else "📊"
-                print(f"   {sentiment_emoji} {article['title']} [{article['publisher']}]")
-                if article['summary']:
-                    print(f"      {article['summary'][:150]}...")
-
-        if args.headlines:
-            # Show recent headlines
-            headlines = fetcher.get_recent_headlines(args.headlines, args.category)
-            category_text = f" ({args.category.replace('_', ' ').title()})" if args.category else ""
-            print(f"\n📰 Recent Gold Headlines{category_text}:")
-            for i, article in enumerate(headlines, 1):
-                sentiment_emoji = "📈" if article['sentiment_score'] > 0.1 else "📉" if article['sentiment_score'] < -0.1 else "📊"
-                date_str = article['published_date'][:19] if article['published_date'] else 'Unknown'
-                print(f"   {i}. {sentiment_emoji} {article['title']}")
-                print(f"      {article['publisher']} | {date_str} | Sentiment: {article['sentiment_score']:.2f}")
-
-        # Default behavior: show summary if no specific action
-        if not any([args.fetch, args.summary, args.search, args.headlines]):
-            fetcher.display_news_summary()
-
+        run(fetch=args.fetch, summary=args.summary, search=args.search,
+            headlines=args.headlines, category=args.category)
     except KeyboardInterrupt:
         logger.info("Process interrupted by user")
     except Exception as e:
@@ -418,8 +418,53 @@ class TradingAnalyzer:
             }
 
 
+def run(interval: Optional[str] = None, hours: Optional[int] = None,
+        include_news: bool = True, fetch_news: bool = False,
+        analyzer: Optional[TradingAnalyzer] = None) -> TradingAnalyzer:
+    """Get, display and save a trading recommendation.
+
+    Pass an existing analyzer to reuse it; the analyzer used is returned.
+    """
+    # Fetch news if requested
+    if fetch_news:
+        try:
+            from news_fetcher import GoldNewsFetcher
+            logger.info("Fetching latest gold news...")
+            news_fetcher = GoldNewsFetcher()
+            results = news_fetcher.fetch_and_cache_gold_news()
+            total_new = sum(results.values())
+            logger.info(f"Fetched {total_new} new articles")
+        except ImportError as e:
+            logger.warning(f"News fetching not available: {e}")
+        except Exception as e:
+            logger.error(f"Error fetching news: {e}")
+
+    analyzer = analyzer or TradingAnalyzer(include_news=include_news)
+
+    # Get trading recommendation
+    logger.info(f"Getting trading recommendation using {config.ollama_host}...")
+    recommendation = analyzer.get_trading_recommendation(interval=interval, hours=hours)
+
+    # Display recommendation
+    analyzer.display_recommendation(recommendation)
+
+    # Save to database
+    analyzer.save_recommendation(recommendation)
+
+    # Optionally show recent history
+    print(f"\n📜 Recent Recommendation History:")
+    history = analyzer.get_recommendation_history(5)
+    if not history.empty:
+        for _, row in history.iterrows():
+            print(f"• {row['timestamp'][:19]} - Price: ${row['current_price']:.2f} - {row['recommendation_preview']}...")
+
+    return analyzer
+
+
 def main():
     """Main function to run trading analysis."""
+    config.init()
+
     import argparse
 
     parser = argparse.ArgumentParser(description='AI-powered Gold Trading Analysis')
@@ -440,40 +485,9 @@ def main():
         config.print_config_summary()
         return
 
-    # Fetch news if requested
-    if args.fetch_news:
-        try:
-            from news_fetcher import GoldNewsFetcher
-            logger.info("Fetching latest gold news...")
-            news_fetcher = GoldNewsFetcher()
-            results = news_fetcher.fetch_and_cache_gold_news()
-            total_new = sum(results.values())
-            logger.info(f"Fetched {total_new} new articles")
-        except ImportError as e:
-            logger.warning(f"News fetching not available: {e}")
-        except Exception as e:
-            logger.error(f"Error fetching news: {e}")
-
-    analyzer = TradingAnalyzer(include_news=not args.no_news)
-
     try:
-        # Get trading recommendation
-        logger.info(f"Getting trading recommendation using {config.ollama_host}...")
-        recommendation = analyzer.get_trading_recommendation(interval=args.interval, hours=args.hours)
-
-        # Display recommendation
-        analyzer.display_recommendation(recommendation)
-
-        # Save to database
-        analyzer.save_recommendation(recommendation)
-
-        # Optionally show recent history
-        print(f"\n📜 Recent Recommendation History:")
-        history = analyzer.get_recommendation_history(5)
-        if not history.empty:
-            for _, row in history.iterrows():
-                print(f"• {row['timestamp'][:19]} - Price: ${row['current_price']:.2f} - {row['recommendation_preview']}...")
-
+        run(interval=args.interval, hours=args.hours,
+            include_news=not args.no_news, fetch_news=args.fetch_news)
     except Exception as e:
         logger.error(f"Error in main execution: {e}")
 
@@ -293,43 +293,18 @@ class NewsViewer:
         print(f"   Cached: {article['created_at'][:19]}")
         print("="*80)
 
-def main():
-    """Main function for interactive news viewing."""
-    parser = argparse.ArgumentParser(description='Interactive Gold News Viewer')
+def run(stats: bool = False, browse: bool = False, search: Optional[str] = None,
+        article: Optional[int] = None, category: Optional[str] = None, days: int = 7,
+        limit: int = 20, min_sentiment: Optional[float] = None, details: bool = False,
+        interactive: bool = False, viewer: Optional[NewsViewer] = None) -> NewsViewer:
+    """Run one viewer command, or the interactive prompt.
 
-    # Main commands
-    parser.add_argument('--stats', '-s', action='store_true',
-                       help='Show news database statistics')
-    parser.add_argument('--browse', '-b', action='store_true',
-                       help='Browse recent headlines')
-    parser.add_argument('--search', type=str,
-                       help='Search articles by keyword')
-    parser.add_argument('--article', '-a', type=int,
-                       help='View specific article by ID')
-
-    # Filters
-    parser.add_argument('--category', choices=['monetary_policy', 'supply_demand', 'market_movement',
-                                              'geopolitical', 'economic_data', 'general'],
-                       help='Filter by category')
-    parser.add_argument('--days', '-d', type=int, default=7,
-                       help='Days to look back (default: 7)')
-    parser.add_argument('--limit', '-l', type=int, default=20,
-                       help='Maximum articles to show (default: 20)')
-    parser.add_argument('--min-sentiment', type=float,
-                       help='Minimum sentiment score (-1.0 to 1.0)')
-    parser.add_argument('--details', action='store_true',
-                       help='Show article summaries in browse mode')
+    Pass an existing viewer to reuse it; the viewer used is returned.
+    """
+    viewer = viewer or NewsViewer()
 
     # Interactive mode
-    parser.add_argument('--interactive', '-i', action='store_true',
-                       help='Start interactive mode')
-
-    args = parser.parse_args()
-
-    viewer = NewsViewer()
-
-    # Interactive mode
-    if args.interactive:
+    if interactive:
         print("🏆 Welcome to Gold News Interactive Viewer!")
         print("Commands: stats, browse, search <term>, article <id>, quit")
 
@@ -344,8 +319,8 @@ def main():
                 elif command[0] == 'stats':
                     viewer.print_news_stats()
                 elif command[0] == 'browse':
-                    limit = int(command[1]) if len(command) > 1 else 10
-                    articles = viewer.browse_headlines(limit=limit, days=7)
+                    count = int(command[1]) if len(command) > 1 else 10
+                    articles = viewer.browse_headlines(limit=count, days=7)
                     viewer.print_headlines(articles)
                 elif command[0] == 'search' and len(command) > 1:
                     query = ' '.join(command[1:])
@@ -353,9 +328,9 @@ def main():
                     viewer.print_headlines(articles)
                 elif command[0] == 'article' and len(command) > 1:
                     article_id = int(command[1])
-                    article = viewer.get_article_details(article_id)
-                    if article:
-                        viewer.print_article_details(article)
+                    found = viewer.get_article_details(article_id)
+                    if found:
+                        viewer.print_article_details(found)
                     else:
                         print(f"❌ Article {article_id} not found")
                 else:
@@ -367,41 +342,83 @@ def main():
             except Exception as e:
                 print(f"❌ Error: {e}")
 
-        return
+        return viewer
 
     # Command-line mode
-    if args.stats:
+    if stats:
         viewer.print_news_stats()
 
-    elif args.browse:
+    elif browse:
         articles = viewer.browse_headlines(
-            limit=args.limit,
-            category=args.category,
-            days=args.days,
-            min_sentiment=args.min_sentiment
+            limit=limit,
+            category=category,
+            days=days,
+            min_sentiment=min_sentiment
         )
-        viewer.print_headlines(articles, show_details=args.details)
+        viewer.print_headlines(articles, show_details=details)
 
-    elif args.search:
-        articles = viewer.search_articles(args.search, args.limit)
-        print(f"🔍 Search results for '{args.search}':")
-        viewer.print_headlines(articles, show_details=args.details)
+    elif search:
+        articles = viewer.search_articles(search, limit)
+        print(f"🔍 Search results for '{search}':")
+        viewer.print_headlines(articles, show_details=details)
 
-    elif args.article:
-        article = viewer.get_article_details(args.article)
-        if article:
-            viewer.print_article_details(article)
+    elif article:
+        found = viewer.get_article_details(article)
+        if found:
+            viewer.print_article_details(found)
         else:
-            print(f"❌ Article {args.article} not found")
+            print(f"❌ Article {article} not found")
 
     else:
         # Default: show stats and recent headlines
         viewer.print_news_stats()
-        print(f"\n📰 Recent Headlines (last {args.days} days):")
-        articles = viewer.browse_headlines(limit=10, days=args.days)
+        print(f"\n📰 Recent Headlines (last {days} days):")
+        articles = viewer.browse_headlines(limit=10, days=days)
         viewer.print_headlines(articles[:5])
 
         print(f"\n💡 Use --help for more options or --interactive for interactive mode")
 
+    return viewer
+
+
+def main():
+    """Main function for interactive news viewing."""
+    config.init()
+
+    parser = argparse.ArgumentParser(description='Interactive Gold News Viewer')
+
+    # Main commands
+    parser.add_argument('--stats', '-s', action='store_true',
+                       help='Show news database statistics')
+    parser.add_argument('--browse', '-b', action='store_true',
+                       help='Browse recent headlines')
+    parser.add_argument('--search', type=str,
+                       help='Search articles by keyword')
+    parser.add_argument('--article', '-a', type=int,
+                       help='View specific article by ID')
+
+    # Filters
+    parser.add_argument('--category', choices=['monetary_policy', 'supply_demand', 'market_movement',
+                                              'geopolitical', 'economic_data', 'general'],
+                       help='Filter by category')
+    parser.add_argument('--days', '-d', type=int, default=7,
+                       help='Days to look back (default: 7)')
+    parser.add_argument('--limit', '-l', type=int, default=20,
+                       help='Maximum articles to show (default: 20)')
+    parser.add_argument('--min-sentiment', type=float,
+                       help='Minimum sentiment score (-1.0 to 1.0)')
+    parser.add_argument('--details', action='store_true',
+                       help='Show article summaries in browse mode')
+
+    # Interactive mode
+    parser.add_argument('--interactive', '-i', action='store_true',
+                       help='Start interactive mode')
+
+    args = parser.parse_args()
+
+    run(stats=args.stats, browse=args.browse, search=args.search, article=args.article,
+        category=args.category, days=args.days, limit=args.limit,
+        min_sentiment=args.min_sentiment, details=args.details, interactive=args.interactive)
+
 if __name__ == "__main__":
     main()
@@ -6,17 +6,31 @@ A comprehensive terminal interface for all Gold Digger functionality.
 
 import sys
 import os
+import atexit
+import asyncio
+import importlib
+import importlib.util
 import logging
+import re
+import sqlite3
+import threading
+import types
+from contextlib import contextmanager
 from datetime import datetime
 import argparse
 from typing import Optional, Dict, Any
 
+try:
+    import termios
+    import tty
+except ImportError:  # Windows: menu choices are read as whole lines
+    termios = None
+
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 try:
     from config import get_config
-    import pandas as pd
     # Import other modules as needed in functions to avoid circular imports
 except ImportError as e:
     print(f"❌ Import error: {e}")
@@ -28,6 +42,91 @@ config = get_config()
 logger = logging.getLogger(__name__)
 
 
+class LazyImport(types.ModuleType):
+    """Module placeholder that imports the real module on first attribute access.
+
+    After the first lookup the placeholder takes over the real module's
+    namespace and becomes a plain module, so later lookups cost nothing extra.
+    """
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        self.__class__ = types.ModuleType
+        return getattr(module, attr)
+
+
+# Feature modules, imported only when a menu option first needs them
+gold_fetcher = LazyImport('gold_fetcher')
+news_fetcher = LazyImport('news_fetcher')
+trading_analyzer = LazyImport('trading_analyzer')
+news_analyzer = LazyImport('news_analyzer')
+news_viewer = LazyImport('news_viewer')
+export_news_html = LazyImport('export_news_html')
+configure = LazyImport('configure')
+query_example = LazyImport('query_example')
+
+# Only the CSV export needs pandas
+pd = LazyImport('pandas')
+
+# Modules behind the most used options, imported while the user reads the menu
+WARM_MODULES = (gold_fetcher, news_fetcher)
+
+# Upper bound on workflow stages (network fetches, LLM calls) running at once
+MAX_CONCURRENT_STAGES = 2
+
+# Price tables by interval; only these names are ever formatted into SQL
+PRICE_TABLES = {'15m': 'gold_prices_15m', '30m': 'gold_prices_30m'}
+
+# Rows per chunk when streaming a CSV export
+EXPORT_CHUNK_ROWS = 10000
+
+# Tuning for the terminal's shared read-mostly price database connection
+DB_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-65536',
+    'PRAGMA temp_store=MEMORY',
+)
+
+# Whole-string signed integer, checked before int() so bad input never raises
+_INT_RE = re.compile(r'^-?\d+$')
+
+# Erase display and move the cursor home
+CLEAR_SCREEN = '\x1b[2J\x1b[H'
+
+# First keys of two-digit menu options (10-19, 20-22); any other key dispatches at once
+MULTI_KEY_PREFIXES = frozenset('12')
+
+
+@contextmanager
+def _argv(argv):
+    """Temporarily replace sys.argv for a main() that only takes arguments from it."""
+    old_argv = sys.argv
+    sys.argv = argv
+    try:
+        yield
+    finally:
+        sys.argv = old_argv
+
+
+def enable_ansi_escapes():
+    """Let the Windows 10+ console interpret ANSI escape sequences."""
+    if os.name != 'nt':
+        return
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+            kernel32.SetConsoleMode(handle, mode.value | 0x0004)
+    except Exception as e:
+        logger.debug(f"Could not enable ANSI escapes: {e}")
+
+
 class GoldDiggerTerminal:
     """Unified terminal application for Gold Digger functionality."""
 
@@ -39,14 +138,107 @@ class GoldDiggerTerminal:
         self.news_fetcher = None
         self.news_analyzer = None
         self.news_viewer = None
-        self.data_analyzer = None
+        self._data_analyzer = None
+        self._db = None
+        self._warmed = False
+        self._section_cache: Dict[str, str] = {}
+        enable_ansi_escapes()
+
+        # Menu dispatch table, built once
+        self._handlers = {
+            '1': self.handle_price_fetch,
+            '2': self.handle_trading_analysis,
+            '3': self.handle_price_summary,
+            '4': self.handle_export_prices,
+            '5': self.handle_news_fetch,
+            '6': self.handle_news_summary,
+            '7': self.handle_interactive_news,
+            '8': self.handle_sentiment_analysis,
+            '9': self.handle_search_news,
+            '10': self.handle_export_news,
+            '11': self.handle_complete_analysis,
+            '12': self.handle_quick_analysis,
+            '13': self.handle_news_only_analysis,
+            '14': self.handle_price_only_analysis,
+            '15': self.handle_database_queries,
+            '16': self.handle_database_stats,
+            '17': self.handle_recent_headlines,
+            '18': self.handle_category_analysis,
+            '19': self.handle_view_config,
+            '20': self.handle_setup_wizard,
+            '21': self.handle_test_setup,
+            '22': self.handle_install_dependencies,
+            '0': self.handle_exit,
+            'h': lambda: None,  # Menu is shown again on the next loop
+            'c': self.handle_clear,
+        }
+
+        # Header and menu never change, so render and encode them once
+        self._header_str = self._render_header()
+        self._menu_str = self._render_menu()
+        self._header_bytes = self._encode_for_stdout(self._header_str)
+        self._menu_bytes = self._encode_for_stdout(self._menu_str)
+
+    @property
+    def data_analyzer(self):
+        """Price data analyzer, constructed the first time a handler needs it."""
+        if self._data_analyzer is None:
+            self._data_analyzer = query_example.GoldDataAnalyzer(config.database_path, conn=self._db)
+        return self._data_analyzer
+
+    def close(self):
+        """Close the shared database connection."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    @staticmethod
+    async def _run_stages(*stages):
+        """Run blocking workflow stages concurrently in worker threads.
+
+        Returns the stage results in order; the first failing stage's exception
+        is raised once all stages have finished.
+        """
+        limit = asyncio.Semaphore(MAX_CONCURRENT_STAGES)
+
+        async def bounded(stage):
+            async with limit:
+                return await asyncio.to_thread(stage)
+
+        results = await asyncio.gather(*(bounded(stage) for stage in stages),
+                                       return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return results
+
+    def _warm_imports(self):
+        """Import the likeliest feature modules in the background, once."""
+        if self._warmed:
+            return
+        self._warmed = True
+
+        def warm():
+            for module in WARM_MODULES:
+                try:
+                    importlib.import_module(module.__name__)
+                except Exception as e:
+                    logger.debug(f"Could not pre-import {module.__name__}: {e}")
+
+        threading.Thread(target=warm, name="warm-imports", daemon=True).start()
 
     def initialize_components(self):
-        """Initialize all component instances."""
+        """Check that component modules are available without importing them."""
         try:
-            # Initialize basic components - others will be imported as needed
-            from query_example import GoldDataAnalyzer
-            self.data_analyzer = GoldDataAnalyzer()
+            # Components themselves are imported and created lazily on first use
+            if importlib.util.find_spec(query_example.__name__) is None:
+                raise ImportError(f"No module named '{query_example.__name__}'")
+
+            # One connection shared by all price handlers for the whole session
+            self._db = sqlite3.connect(config.database_path, check_same_thread=False)
+            for pragma in DB_PRAGMAS:
+                self._db.execute(pragma)
+            atexit.register(self.close)
             return True
         except Exception as e:
             print(f"❌ Error initializing components: {e}")
@@ -54,13 +246,45 @@ class GoldDiggerTerminal:
 
     def print_header(self):
         """Print the main application header."""
-        print("\n" + "=" * 80)
-        print("🏆 GOLD DIGGER TERMINAL - Unified Trading Analysis System")
-        print("📊 Price Data • 📰 News Intelligence • 🤖 AI Analysis • ⚙️ Complete Automation")
-        print("=" * 80)
+        self._write_static(self._header_str, self._header_bytes)
 
     def print_menu(self):
         """Print the main menu options."""
+        self._write_static(self._menu_str, self._menu_bytes)
+
+    @staticmethod
+    def _encode_for_stdout(text: str) -> Optional[bytes]:
+        """Encode constant text the way stdout's text layer would, or None if it has no byte layer."""
+        if not hasattr(sys.stdout, 'buffer'):
+            return None
+        encoding = getattr(sys.stdout, 'encoding', None) or 'utf-8'
+        return text.replace('\n', os.linesep).encode(encoding, errors='replace')
+
+    @staticmethod
+    def _write_static(text: str, data: Optional[bytes]):
+        """Write pre-encoded constant text straight to stdout's byte buffer."""
+        if data is None:
+            sys.stdout.write(text)
+        else:
+            sys.stdout.flush()  # keep ordering with text already written
+            sys.stdout.buffer.write(data)
+        sys.stdout.flush()
+
+    @staticmethod
+    def _render_header() -> str:
+        """Render the main application header."""
+        lines = [
+            "",
+            "=" * 80,
+            "🏆 GOLD DIGGER TERMINAL - Unified Trading Analysis System",
+            "📊 Price Data • 📰 News Intelligence • 🤖 AI Analysis • ⚙️ Complete Automation",
+            "=" * 80,
+        ]
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_menu() -> str:
+        """Render the main menu options."""
         menu_options = [
             ("📊 PRICE DATA & ANALYSIS", [
                 ("1", "Fetch Gold Prices (15m/30m intervals)"),
@@ -101,15 +325,15 @@ class GoldDiggerTerminal:
             ])
         ]
 
-        print("\n📋 MAIN MENU")
-        print("-" * 50)
+        lines = ["", "📋 MAIN MENU", "-" * 50]
 
         for category, options in menu_options:
-            print(f"\n{category}")
+            lines.append(f"\n{category}")
             for key, description in options:
-                print(f"  {key:2s}) {description}")
+                lines.append(f"  {key:2s}) {description}")
 
-        print("\n" + "-" * 50)
+        lines.append("\n" + "-" * 50)
+        return "\n".join(lines) + "\n"
 
     def get_user_input(self, prompt: str = "Enter your choice", default: str = None) -> str:
         """Get user input with optional default."""
@@ -126,27 +350,59 @@ class GoldDiggerTerminal:
             self.running = False
             return ""
 
+    def read_choice(self, prompt: str = "Enter your choice") -> str:
+        """Read a menu choice without waiting for Enter when stdin is a terminal."""
+        if termios is None or not sys.stdin.isatty():
+            return self.get_user_input(prompt).lower()
+
+        sys.stdout.write(f"{prompt}: ")
+        sys.stdout.flush()
+
+        fd = sys.stdin.fileno()
+        saved = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            choice = os.read(fd, 4).decode(errors='ignore')
+            # '1' and '2' may start a two-digit option: wait for the next key
+            if choice in MULTI_KEY_PREFIXES:
+                choice += os.read(fd, 4).decode(errors='ignore')
+        except KeyboardInterrupt:
+            choice = '\x04'
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+        if '\x04' in choice:  # Ctrl-D / Ctrl-C
+            print("\n\n👋 Goodbye!")
+            self.running = False
+            return ""
+
+        choice = choice.strip().lower()
+        print(choice)  # cbreak mode does not echo
+        return choice
+
     def get_numeric_input(self, prompt: str, default: int = None, min_val: int = None, max_val: int = None) -> Optional[int]:
-        """Get numeric input with validation."""
+        """Get numeric input with validation; out-of-range values are clamped."""
         while True:
-            try:
-                value_str = self.get_user_input(prompt, str(default) if default else None)
-                if not value_str and default is not None:
-                    return default
-
-                value = int(value_str)
-                if min_val is not None and value < min_val:
-                    print(f"❌ Value must be at least {min_val}")
-                    continue
-                if max_val is not None and value > max_val:
-                    print(f"❌ Value must be at most {max_val}")
-                    continue
-
-                return value
-            except ValueError:
-                print("❌ Please enter a valid number")
-            except (EOFError, KeyboardInterrupt):
+            value_str = self.get_user_input(prompt, str(default) if default else None)
+            if not self.running:
                 return None
+            if not value_str and default is not None:
+                return default
+
+            if not _INT_RE.match(value_str):
+                print("❌ Please enter a valid number")
+                continue
+
+            value = int(value_str)
+            clamped = value
+            if min_val is not None:
+                clamped = max(clamped, min_val)
+            if max_val is not None:
+                clamped = min(clamped, max_val)
+            if clamped != value:
+                print(f"⚠️ {value} is out of range, using {clamped}")
+
+            return clamped
 
     def pause(self, message: str = "Press Enter to continue..."):
         """Pause execution and wait for user input."""
@@ -155,632 +411,296 @@ class GoldDiggerTerminal:
         except (EOFError, KeyboardInterrupt):
             pass
 
-    def handle_price_fetch(self):
-        """Handle gold price fetching."""
-        print("\n📊 GOLD PRICE FETCHER")
-        print("-" * 40)
+    @contextmanager
+    def _section(self, title: str, error: str, pause: bool = True):
+        """Print a handler's banner, report its errors, then pause.
 
-        days = self.get_numeric_input("Days to fetch", config.default_fetch_days, 1, 365)
-        if days is None:
-            return
+        Errors are printed as "❌ <error>: <exception>". KeyboardInterrupt
+        propagates to the main loop.
+        """
+        banner = self._section_cache.get(title)
+        if banner is None:
+            banner = self._section_cache[title] = f"\n{title}\n{'-' * 40}\n"
+        sys.stdout.write(banner)
+        sys.stdout.flush()
 
-        print(f"🔄 Fetching {days} days of gold price data...")
         try:
-            from gold_fetcher import main as price_main
-            import sys
+            yield
+        except Exception as e:
+            print(f"❌ {error}: {e}")
 
-            old_argv = sys.argv
-            sys.argv = ['gold_fetcher.py', '--days', str(days)]
+        if pause and self.running:
+            self.pause()
 
-            try:
-                price_main()
-                print("✅ Price data fetched successfully!")
-            finally:
-                sys.argv = old_argv
-        except Exception as e:
-            print(f"❌ Error fetching prices: {e}")
+    def handle_price_fetch(self):
+        """Handle gold price fetching."""
+        with self._section("📊 GOLD PRICE FETCHER", "Error fetching prices"):
+            days = self.get_numeric_input("Days to fetch", config.default_fetch_days, 1, 365)
+            if days is None:
+                return
 
-        self.pause()
+            print(f"🔄 Fetching {days} days of gold price data...")
+            self.price_fetcher = gold_fetcher.run(days=days, fetcher=self.price_fetcher)
+            print("✅ Price data fetched successfully!")
 
     def handle_trading_analysis(self):
         """Handle AI trading analysis."""
-        print("\n🤖 AI TRADING ANALYSIS")
-        print("-" * 40)
+        with self._section("🤖 AI TRADING ANALYSIS", "Error in trading analysis"):
+            interval = self.get_user_input("Interval (15m/30m)", config.default_interval)
+            hours = self.get_numeric_input("Hours to analyze", config.default_analysis_hours, 1, 168)
 
-        interval = self.get_user_input("Interval (15m/30m)", config.default_interval)
-        hours = self.get_numeric_input("Hours to analyze", config.default_analysis_hours, 1, 168)
+            if hours is None:
+                return
 
-        if hours is None:
-            return
-
-        print(f"🔄 Running AI trading analysis...")
-        print(f"   Interval: {interval}")
-        print(f"   Hours: {hours}")
-
-        try:
-            from trading_analyzer import main as trading_main
-            import sys
+            print(f"🔄 Running AI trading analysis...")
+            print(f"   Interval: {interval}")
+            print(f"   Hours: {hours}")
 
-            old_argv = sys.argv
-            sys.argv = ['trading_analyzer.py', '--interval', interval, '--hours', str(hours)]
-
-            try:
-                trading_main()
-            finally:
-                sys.argv = old_argv
-        except Exception as e:
-            print(f"❌ Error in trading analysis: {e}")
-
-        self.pause()
+            self.trading_analyzer = trading_analyzer.run(
+                interval=interval, hours=hours, analyzer=self.trading_analyzer)
 
     def handle_price_summary(self):
         """Handle price data summary."""
-        print("\n📈 PRICE DATA SUMMARY")
-        print("-" * 40)
-
-        try:
+        with self._section("📈 PRICE DATA SUMMARY", "Error getting price summary"):
             self.data_analyzer.get_latest_prices()
             print()
             self.data_analyzer.get_daily_summary()
-        except Exception as e:
-            print(f"❌ Error getting price summary: {e}")
-
-        self.pause()
 
     def handle_export_prices(self):
         """Handle price data export."""
-        print("\n📤 EXPORT PRICE DATA")
-        print("-" * 40)
+        with self._section("📤 EXPORT PRICE DATA", "Export error"):
+            interval = self.get_user_input("Interval (15m/30m)", "15m")
+            days = self.get_numeric_input("Days to export", 7, 1, 365)
 
-        interval = self.get_user_input("Interval (15m/30m)", "15m")
-        days = self.get_numeric_input("Days to export", 7, 1, 365)
+            if days is None:
+                return
 
-        if days is None:
-            return
+            table_name = PRICE_TABLES.get(interval)
+            if table_name is None:
+                print(f"❌ Invalid interval '{interval}'. Choose from: {', '.join(PRICE_TABLES)}")
+                return
 
-        try:
             filename = f"gold_{interval}_{days}days.csv"
-            # Export logic using direct database query
-            import sqlite3
-            table_name = f"gold_prices_{interval}"
-            with sqlite3.connect("gold_prices.db") as conn:
-                query = f"""
-                    SELECT * FROM {table_name}
-                    WHERE datetime >= date('now', '-{days} days')
-                    ORDER BY datetime DESC
-                """
-                df = pd.read_sql_query(query, conn)
-                df.to_csv(filename, index=False)
+            # Export logic using direct database query, streamed in chunks
+            # datetime is the primary key, so this is a range seek on its index
+            query = f"""
+                SELECT * FROM {table_name}
+                WHERE datetime >= date('now', ? || ' days')
+                ORDER BY datetime DESC
+            """
+            chunks = pd.read_sql_query(query, self._db, params=(f'-{days}',),
+                                       chunksize=EXPORT_CHUNK_ROWS)
+            for i, chunk in enumerate(chunks):
+                chunk.to_csv(filename, mode='w' if i == 0 else 'a',
+                             header=(i == 0), index=False)
             print(f"✅ Data exported to {filename}")
-        except Exception as e:
-            print(f"❌ Export error: {e}")
-
-        self.pause()
 
     def handle_news_fetch(self):
         """Handle news fetching."""
-        print("\n📰 GOLD NEWS FETCHER")
-        print("-" * 40)
+        with self._section("📰 GOLD NEWS FETCHER", "Error fetching news"):
+            print("🔄 Fetching latest gold news...")
+            self.news_fetcher = news_fetcher.run(fetch=True, fetcher=self.news_fetcher)
+            print("✅ News fetched successfully!")
 
-        print("🔄 Fetching latest gold news...")
-        try:
-            # Call the main function from news_fetcher
-            from news_fetcher import main as news_main
-            import sys
-            from io import StringIO
-
-            # Capture output
-            old_argv = sys.argv
-            sys.argv = ['news_fetcher.py', '--fetch']
-
-            try:
-                news_main()
-                print("✅ News fetched successfully!")
-
-                # Show summary
-                sys.argv = ['news_fetcher.py', '--summary']
-                news_main()
-            finally:
-                sys.argv = old_argv
-        except Exception as e:
-            print(f"❌ Error fetching news: {e}")
-
-        self.pause()
+            # Show summary
+            news_fetcher.run(summary=True, fetcher=self.news_fetcher)
 
     def handle_news_summary(self):
         """Handle news summary display."""
-        print("\n📊 NEWS SUMMARY")
-        print("-" * 40)
-
-        try:
-            from news_fetcher import main as news_main
-            import sys
-
-            old_argv = sys.argv
-            sys.argv = ['news_fetcher.py', '--summary']
-
-            try:
-                news_main()
-            finally:
-                sys.argv = old_argv
-        except Exception as e:
-            print(f"❌ Error displaying news summary: {e}")
-
-        self.pause()
+        with self._section("📊 NEWS SUMMARY", "Error displaying news summary"):
+            self.news_fetcher = news_fetcher.run(summary=True, fetcher=self.news_fetcher)
 
     def handle_interactive_news(self):
         """Handle interactive news browser."""
-        print("\n🔍 INTERACTIVE NEWS BROWSER")
-        print("-" * 40)
-        print("Available commands: stats, browse [n], search <keyword>, article <id>, quit")
-
-        try:
-            from news_viewer import main as viewer_main
-            import sys
-
-            old_argv = sys.argv
-            sys.argv = ['news_viewer.py', '--interactive']
-
-            try:
-                viewer_main()
-            finally:
-                sys.argv = old_argv
-        except Exception as e:
-            print(f"❌ Error in interactive news browser: {e}")
+        with self._section("🔍 INTERACTIVE NEWS BROWSER", "Error in interactive news browser",
+                           pause=False):
+            print("Available commands: stats, browse [n], search <keyword>, article <id>, quit")
+            self.news_viewer = news_viewer.run(interactive=True, viewer=self.news_viewer)
 
     def handle_sentiment_analysis(self):
         """Handle news sentiment analysis."""
-        print("\n📈 NEWS SENTIMENT ANALYSIS")
-        print("-" * 40)
-
-        days = self.get_numeric_input("Days to analyze", 7, 1, 30)
-        if days is None:
-            return
+        with self._section("📈 NEWS SENTIMENT ANALYSIS", "Error in sentiment analysis"):
+            days = self.get_numeric_input("Days to analyze", 7, 1, 30)
+            if days is None:
+                return
 
-        try:
-            from news_analyzer import main as analyzer_main
-            import sys
-
-            old_argv = sys.argv
-            sys.argv = ['news_analyzer.py', '--sentiment', '--days', str(days)]
-
-            try:
-                analyzer_main()
-            finally:
-                sys.argv = old_argv
-        except Exception as e:
-            print(f"❌ Error in sentiment analysis: {e}")
-
-        self.pause()
+            self.news_analyzer = news_analyzer.run(sentiment=True, days=days, analyzer=self.news_analyzer)
 
     def handle_search_news(self):
         """Handle news search."""
-        print("\n🔍 SEARCH NEWS")
-        print("-" * 40)
+        with self._section("🔍 SEARCH NEWS", "Search error"):
+            keyword = self.get_user_input("Enter search keyword")
+            if not keyword:
+                return
 
-        keyword = self.get_user_input("Enter search keyword")
-        if not keyword:
-            return
-
-        try:
-            from news_viewer import main as viewer_main
-            import sys
-
-            old_argv = sys.argv
-            sys.argv = ['news_viewer.py', '--search', keyword, '--details']
-
-            try:
-                viewer_main()
-            finally:
-                sys.argv = old_argv
-        except Exception as e:
-            print(f"❌ Search error: {e}")
-
-        self.pause()
+            self.news_viewer = news_viewer.run(search=keyword, details=True, viewer=self.news_viewer)
 
     def handle_export_news(self):
         """Handle news export to HTML."""
-        print("\n📤 EXPORT NEWS TO HTML")
-        print("-" * 40)
-
-        days = self.get_numeric_input("Days to include", 7, 1, 30)
-        filename = self.get_user_input("Output filename", "gold_news_report.html")
-
-        if days is None:
-            return
-
-        try:
-            from export_news_html import main as export_main
-            import sys
-
-            old_argv = sys.argv
-            sys.argv = ['export_news_html.py', '--days', str(days), '--output', filename]
+        with self._section("📤 EXPORT NEWS TO HTML", "Export error"):
+            days = self.get_numeric_input("Days to include", 7, 1, 30)
+            filename = self.get_user_input("Output filename", "gold_news_report.html")
 
-            try:
-                export_main()
-            finally:
-                sys.argv = old_argv
-            print(f"✅ News exported to {filename}")
-        except Exception as e:
-            print(f"❌ Export error: {e}")
+            if days is None:
+                return
 
-        self.pause()
+            if export_news_html.run(output=filename, days=days):
+                print(f"✅ News exported to {filename}")
 
     def handle_complete_analysis(self):
         """Handle complete analysis workflow."""
-        print("\n🏆 COMPLETE ANALYSIS")
-        print("-" * 40)
-
-        days = self.get_numeric_input("Days of data to analyze", config.default_fetch_days, 1, 30)
-        if days is None:
-            return
-
-        print("🔄 Running complete analysis workflow...")
+        with self._section("🏆 COMPLETE ANALYSIS", "Error in complete analysis"):
+            days = self.get_numeric_input("Days of data to analyze", config.default_fetch_days, 1, 30)
+            if days is None:
+                return
 
-        try:
-            # Fetch prices
-            print("📊 1. Fetching price data...")
-            from gold_fetcher import main as price_main
-            import sys
-
-            old_argv = sys.argv
-            sys.argv = ['gold_fetcher.py', '--days', str(days)]
-
-            try:
-                price_main()
-            finally:
-                sys.argv = old_argv
-
-            # Fetch news
-            print("📰 2. Fetching news data...")
-            from news_fetcher import main as news_main
-            sys.argv = ['news_fetcher.py', '--fetch']
-
-            try:
-                news_main()
-            finally:
-                sys.argv = old_argv
-
-            # Run analysis
-            print("🤖 3. Running AI analysis...")
-            from trading_analyzer import main as trading_main
-            import sys
-
-            old_argv = sys.argv
-            sys.argv = ['trading_analyzer.py']
-
-            try:
-                trading_main()
-            finally:
-                sys.argv = old_argv
-
-            print("📈 4. Analyzing sentiment...")
-            from news_analyzer import main as analyzer_main
-            sys.argv = ['news_analyzer.py', '--sentiment', '--days', str(days)]
-
-            try:
-                analyzer_main()
-            finally:
-                sys.argv = old_argv
+            print("🔄 Running complete analysis workflow...")
+            asyncio.run(self._complete_analysis(days))
 
             print("\n✅ Complete analysis finished!")
 
-        except Exception as e:
-            print(f"❌ Error in complete analysis: {e}")
-
-        self.pause()
+    async def _complete_analysis(self, days: int):
+        """Fetch prices and news in parallel, then run both analyses in parallel."""
+        print("📊 1. Fetching price data...")
+        print("📰 2. Fetching news data...")
+        self.price_fetcher, self.news_fetcher = await self._run_stages(
+            lambda: gold_fetcher.run(days=days, fetcher=self.price_fetcher),
+            lambda: news_fetcher.run(fetch=True, fetcher=self.news_fetcher),
+        )
+
+        # The AI analysis only needs prices and the sentiment analysis only news
+        print("🤖 3. Running AI analysis...")
+        print("📈 4. Analyzing sentiment...")
+        self.trading_analyzer, self.news_analyzer = await self._run_stages(
+            lambda: trading_analyzer.run(analyzer=self.trading_analyzer),
+            lambda: news_analyzer.run(sentiment=True, days=days, analyzer=self.news_analyzer),
+        )
 
     def handle_quick_analysis(self):
         """Handle quick analysis."""
-        print("\n⚡ QUICK ANALYSIS")
-        print("-" * 40)
-
-        print("🔄 Running quick analysis (price + news + AI)...")
-
-        try:
-            # Quick price fetch (fewer days)
-            from gold_fetcher import main as price_main
-            import sys
+        with self._section("⚡ QUICK ANALYSIS", "Error in quick analysis"):
+            print("🔄 Running quick analysis (price + news + AI)...")
 
-            old_argv = sys.argv
-            sys.argv = ['gold_fetcher.py', '--days', '3']
-
-            try:
-                price_main()
-            finally:
-                sys.argv = old_argv
-
-            # Quick news fetch
-            from news_fetcher import main as news_main
-            sys.argv = ['news_fetcher.py', '--fetch']
-
-            try:
-                news_main()
-            finally:
-                sys.argv = old_argv
+            # Quick price and news fetch (fewer days), in parallel
+            self.price_fetcher, self.news_fetcher = asyncio.run(self._run_stages(
+                lambda: gold_fetcher.run(days=3, fetcher=self.price_fetcher),
+                lambda: news_fetcher.run(fetch=True, fetcher=self.news_fetcher),
+            ))
 
             # Quick AI analysis
-            from trading_analyzer import main as trading_main
-            import sys
-
-            old_argv = sys.argv
-            sys.argv = ['trading_analyzer.py', '--hours', '24']
-
-            try:
-                trading_main()
-            finally:
-                sys.argv = old_argv
+            self.trading_analyzer = trading_analyzer.run(hours=24, analyzer=self.trading_analyzer)
 
             print("\n✅ Quick analysis complete!")
 
-        except Exception as e:
-            print(f"❌ Error in quick analysis: {e}")
-
-        self.pause()
-
     def handle_news_only_analysis(self):
         """Handle news-only analysis."""
-        print("\n📰 NEWS-ONLY ANALYSIS")
-        print("-" * 40)
+        with self._section("📰 NEWS-ONLY ANALYSIS", "Error in news analysis"):
+            days = self.get_numeric_input("Days to analyze", 7, 1, 30)
+            if days is None:
+                return
 
-        days = self.get_numeric_input("Days to analyze", 7, 1, 30)
-        if days is None:
-            return
-
-        try:
             print("🔄 Fetching and analyzing news...")
-            from news_fetcher import main as news_main
-            import sys
-
-            old_argv = sys.argv
-            sys.argv = ['news_fetcher.py', '--fetch']
-
-            try:
-                news_main()
-            finally:
-                sys.argv = old_argv
+            self.news_fetcher = news_fetcher.run(fetch=True, fetcher=self.news_fetcher)
 
             print("📊 News Summary:")
-            from news_fetcher import main as news_main
-            import sys
-
-            old_argv = sys.argv
-            sys.argv = ['news_fetcher.py', '--summary']
-
-            try:
-                news_main()
-            finally:
-                sys.argv = old_argv
+            news_fetcher.run(summary=True, fetcher=self.news_fetcher)
 
             print("📈 Sentiment Analysis:")
-            from news_analyzer import main as analyzer_main
-            sys.argv = ['news_analyzer.py', '--sentiment', '--days', str(days)]
-
-            try:
-                analyzer_main()
-            finally:
-                sys.argv = old_argv
+            self.news_analyzer = news_analyzer.run(sentiment=True, days=days,
+                                                   analyzer=self.news_analyzer)
 
             print("📂 Category Analysis:")
-            sys.argv = ['news_analyzer.py', '--categories']
-
-            try:
-                analyzer_main()
-            finally:
-                sys.argv = old_argv
-
-        except Exception as e:
-            print(f"❌ Error in news analysis: {e}")
-
-        self.pause()
+            news_analyzer.run(categories=True, analyzer=self.news_analyzer)
 
     def handle_price_only_analysis(self):
         """Handle price-only analysis."""
-        print("\n📊 PRICE-ONLY ANALYSIS")
-        print("-" * 40)
-
-        days = self.get_numeric_input("Days to analyze", config.default_fetch_days, 1, 30)
-        if days is None:
-            return
+        with self._section("📊 PRICE-ONLY ANALYSIS", "Error in price analysis"):
+            days = self.get_numeric_input("Days to analyze", config.default_fetch_days, 1, 30)
+            if days is None:
+                return
 
-        try:
             print("🔄 Fetching and analyzing prices...")
-            from gold_fetcher import main as price_main
-            import sys
-
-            old_argv = sys.argv
-            sys.argv = ['gold_fetcher.py', '--days', str(days)]
-
-            try:
-                price_main()
-            finally:
-                sys.argv = old_argv
+            self.price_fetcher = gold_fetcher.run(days=days, fetcher=self.price_fetcher)
 
             print("📈 Price Summary:")
             self.data_analyzer.get_latest_prices()
             self.data_analyzer.get_daily_summary()
 
             print("🤖 Technical Analysis:")
-            from trading_analyzer import main as trading_main
-            import sys
-
-            old_argv = sys.argv
-            sys.argv = ['trading_analyzer.py', '--no-news', '--hours', '48']
-
-            try:
-                trading_main()
-            finally:
-                sys.argv = old_argv
-
-        except Exception as e:
-            print(f"❌ Error in price analysis: {e}")
-
-        self.pause()
+            # Price-only analysis needs its own news-free analyzer
+            trading_analyzer.run(hours=48, include_news=False)
 
     def handle_database_queries(self):
         """Handle database query examples."""
-        print("\n📋 DATABASE QUERY EXAMPLES")
-        print("-" * 40)
-
-        try:
+        with self._section("📋 DATABASE QUERY EXAMPLES", "Error running database queries"):
             self.data_analyzer.get_latest_prices()
             print()
             self.data_analyzer.get_daily_summary()
             print()
             self.data_analyzer.get_volatility_analysis()
-        except Exception as e:
-            print(f"❌ Error running database queries: {e}")
-
-        self.pause()
 
     def handle_database_stats(self):
         """Handle database statistics."""
-        print("\n📊 DATABASE STATISTICS")
-        print("-" * 40)
-
-        try:
-            from news_viewer import main as viewer_main
-            import sys
-
-            old_argv = sys.argv
-            sys.argv = ['news_viewer.py', '--stats']
-
-            try:
-                viewer_main()
-            finally:
-                sys.argv = old_argv
-        except Exception as e:
-            print(f"❌ Error getting database stats: {e}")
-
-        self.pause()
+        with self._section("📊 DATABASE STATISTICS", "Error getting database stats"):
+            self.news_viewer = news_viewer.run(stats=True, viewer=self.news_viewer)
 
     def handle_recent_headlines(self):
         """Handle recent headlines display."""
-        print("\n📰 RECENT HEADLINES")
-        print("-" * 40)
+        with self._section("📰 RECENT HEADLINES", "Error getting headlines"):
+            count = self.get_numeric_input("Number of headlines", 10, 1, 50)
+            if count is None:
+                return
 
-        count = self.get_numeric_input("Number of headlines", 10, 1, 50)
-        if count is None:
-            return
-
-        try:
-            from news_viewer import main as viewer_main
-            import sys
-
-            old_argv = sys.argv
-            sys.argv = ['news_viewer.py', '--browse', '--limit', str(count)]
-
-            try:
-                viewer_main()
-            finally:
-                sys.argv = old_argv
-        except Exception as e:
-            print(f"❌ Error getting headlines: {e}")
-
-        self.pause()
+            self.news_viewer = news_viewer.run(browse=True, limit=count, viewer=self.news_viewer)
 
     def handle_category_analysis(self):
         """Handle news category analysis."""
-        print("\n📂 CATEGORY ANALYSIS")
-        print("-" * 40)
-
-        try:
-            from news_analyzer import main as analyzer_main
-            import sys
-
-            old_argv = sys.argv
-            sys.argv = ['news_analyzer.py', '--categories']
-
-            try:
-                analyzer_main()
-            finally:
-                sys.argv = old_argv
-        except Exception as e:
-            print(f"❌ Error in category analysis: {e}")
-
-        self.pause()
+        with self._section("📂 CATEGORY ANALYSIS", "Error in category analysis"):
+            self.news_analyzer = news_analyzer.run(categories=True, analyzer=self.news_analyzer)
 
     def handle_view_config(self):
         """Handle configuration display."""
-        print("\n⚙️ CURRENT CONFIGURATION")
-        print("-" * 40)
-
-        try:
+        with self._section("⚙️ CURRENT CONFIGURATION", "Error displaying configuration"):
             config.print_config_summary()
-        except Exception as e:
-            print(f"❌ Error displaying configuration: {e}")
-
-        self.pause()
 
     def handle_setup_wizard(self):
         """Handle setup wizard."""
-        print("\n🔧 SETUP WIZARD")
-        print("-" * 40)
-
-        try:
-            from configure import main as config_main
-            import sys
-
-            old_argv = sys.argv
-            sys.argv = ['configure.py', '--quick']
-
+        with self._section("🔧 SETUP WIZARD", "Setup error"):
             try:
-                config_main()
+                with _argv(['configure.py', '--quick']):
+                    configure.main()
                 print("✅ Setup completed!")
-            finally:
-                sys.argv = old_argv
-        except Exception as e:
-            print(f"❌ Setup error: {e}")
-
-        self.pause()
+            except SystemExit:
+                print("❌ Setup did not complete")
 
     def handle_test_setup(self):
         """Handle setup testing."""
-        print("\n🧪 TESTING SYSTEM SETUP")
-        print("-" * 40)
-
-        try:
-            from configure import main as config_main
-            import sys
-
-            old_argv = sys.argv
-            sys.argv = ['configure.py', '--test']
-
-            try:
-                config_main()
+        with self._section("🧪 TESTING SYSTEM SETUP", "Test error"):
+            if configure.test_setup():
                 print("✅ All tests passed!")
-            finally:
-                sys.argv = old_argv
-        except Exception as e:
-            print(f"❌ Test error: {e}")
-
-        self.pause()
 
     def handle_install_dependencies(self):
         """Handle dependency installation."""
-        print("\n📦 INSTALLING DEPENDENCIES")
-        print("-" * 40)
-
-        try:
-            from configure import main as config_main
-            import sys
-
-            old_argv = sys.argv
-            sys.argv = ['configure.py', '--install-deps']
-
-            try:
-                config_main()
+        with self._section("📦 INSTALLING DEPENDENCIES", "Installation error"):
+            missing = configure.check_dependencies()
+            if not missing:
+                print("✅ All dependencies already installed")
+            elif configure.install_dependencies(missing):
                 print("✅ Dependencies installed!")
-            finally:
-                sys.argv = old_argv
-        except Exception as e:
-            print(f"❌ Installation error: {e}")
 
-        self.pause()
+    def handle_exit(self):
+        """Handle leaving the main loop."""
+        self.running = False
+
+    def handle_clear(self):
+        """Handle clearing the screen."""
+        self.clear_screen()
+        self.print_header()
 
     def clear_screen(self):
         """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        sys.stdout.write(CLEAR_SCREEN)
+        sys.stdout.flush()
 
     def run(self):
         """Run the main application loop."""
@@ -797,48 +717,13 @@ class GoldDiggerTerminal:
 
         while self.running:
             self.print_menu()
-            choice = self.get_user_input("Enter your choice").lower()
+            self._warm_imports()
+            choice = self.read_choice()
 
             if not choice or not self.running:
                 break
 
-            if choice == '0':
-                self.running = False
-                continue
-            elif choice == 'h':
-                continue  # Show menu again
-            elif choice == 'c':
-                self.clear_screen()
-                self.print_header()
-                continue
-
-            # Handle menu choices
-            handlers = {
-                '1': self.handle_price_fetch,
-                '2': self.handle_trading_analysis,
-                '3': self.handle_price_summary,
-                '4': self.handle_export_prices,
-                '5': self.handle_news_fetch,
-                '6': self.handle_news_summary,
-                '7': self.handle_interactive_news,
-                '8': self.handle_sentiment_analysis,
-                '9': self.handle_search_news,
-                '10': self.handle_export_news,
-                '11': self.handle_complete_analysis,
-                '12': self.handle_quick_analysis,
-                '13': self.handle_news_only_analysis,
-                '14': self.handle_price_only_analysis,
-                '15': self.handle_database_queries,
-                '16': self.handle_database_stats,
-                '17': self.handle_recent_headlines,
-                '18': self.handle_category_analysis,
-                '19': self.handle_view_config,
-                '20': self.handle_setup_wizard,
-                '21': self.handle_test_setup,
-                '22': self.handle_install_dependencies,
-            }
-
-            handler = handlers.get(choice)
+            handler = self._handlers.get(choice)
             if handler:
                 try:
                     handler()
@@ -857,6 +742,8 @@ class GoldDiggerTerminal:
 
 def main():
     """Main entry point."""
+    config.init()
+
     parser = argparse.ArgumentParser(description='Gold Digger Terminal - Unified Interactive Application')
     parser.add_argument('--test', action='store_true', help='Test system setup and exit')
     parser.add_argument('--config', action='store_true', help='Show configuration and exit')
@@ -866,12 +753,7 @@ def main():
 
     if args.test:
         try:
-            from configure import main as config_main
-
-            old_argv = sys.argv
-            sys.argv = ['configure.py', '--test']
-            config_main()
-            sys.exit(0)
+            sys.exit(0 if configure.test_setup() else 1)
         except Exception as e:
             print(f"❌ Test error: {e}")
             sys.exit(1)
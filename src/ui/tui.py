@@ -720,6 +720,8 @@ class GoldDiggerTUI(App):
 
 def main():
     """Main entry point for the TUI application."""
+    config.init()
+
     import argparse
 
     parser = argparse.ArgumentParser(description='Gold Digger TUI - Modern Interactive Interface')
@@ -7,39 +7,39 @@ A dedicated launcher for the modern TUI interface with dependency checking.
 import sys
 import os
 import subprocess
+import hashlib
+import importlib
+import importlib.util
 from pathlib import Path
 
-def check_dependencies():
-    """Check if required TUI dependencies are installed."""
-    missing_deps = []
-
-    # Check in current Python environment
+def deps_sentinel():
+    """Marker file recording that this interpreter passed the dependency check."""
+    # Keyed on the interpreter and requirements.txt so a new venv or changed
+    # requirements invalidate it automatically
+    digest = hashlib.sha1(sys.executable.encode())
     try:
-        import textual
-    except ImportError:
-        missing_deps.append('textual')
+        digest.update(Path("requirements.txt").read_bytes())
+    except OSError:
+        pass
+    return Path.home() / ".cache" / "gold-digger" / f"deps-tui-{digest.hexdigest()}.ok"
 
+def mark_dependencies_ok(sentinel):
+    """Record a passed dependency check; a failure only means checking again next time."""
     try:
-        import rich
-    except ImportError:
-        missing_deps.append('rich')
+        sentinel.parent.mkdir(parents=True, exist_ok=True)
+        sentinel.touch()
+    except OSError:
+        pass
 
-    # If we're in a virtual environment, dependencies might be available there
-    if Path("venv").exists() and missing_deps:
-        # Try checking in virtual environment
-        venv_python = Path("venv/bin/python3")
-        if venv_python.exists():
-            try:
-                import subprocess
-                result = subprocess.run([
-                    str(venv_python), '-c',
-                    'import textual, rich; print("ok")'
-                ], capture_output=True, text=True)
-                if result.returncode == 0 and "ok" in result.stdout:
-                    # Dependencies are available in venv
-                    return []
-            except:
-                pass
+def check_dependencies():
+    """Check if required TUI dependencies are installed."""
+    missing_deps = []
+
+    # main() has already re-exec'd into the venv interpreter when one exists, so
+    # the current environment is the one the TUI will run in
+    for name in ('textual', 'rich'):
+        if importlib.util.find_spec(name) is None:
+            missing_deps.append(name)
 
     return missing_deps
 
@@ -80,8 +80,9 @@ def main():
                 print(f"❌ Error with virtual environment: {e}")
                 print("Falling back to system Python...")
 
-    # Check dependencies
-    missing_deps = check_dependencies()
+    # Check dependencies, unless a previous launch already verified them
+    sentinel = deps_sentinel()
+    missing_deps = [] if sentinel.exists() else check_dependencies()
     if missing_deps:
         print(f"⚠️  Missing dependencies: {', '.join(missing_deps)}")
         print("Installing dependencies automatically...")
@@ -98,6 +99,16 @@ def main():
             print(f"  pip install {' '.join(missing_deps)}")
             sys.exit(1)
 
+        # Confirm pip's install is importable from this interpreter
+        importlib.invalidate_caches()
+        still_missing = check_dependencies()
+        if still_missing:
+            print(f"❌ Still missing after install: {', '.join(still_missing)}")
+            sys.exit(1)
+
+    if not sentinel.exists():
+        mark_dependencies_ok(sentinel)
+
     # Launch TUI
     print("🚀 Launching Gold Digger TUI...")
     try:
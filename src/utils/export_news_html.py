@@ -4,302 +4,493 @@ Export Gold News to HTML
 Creates a simple HTML file with cached news articles for easy viewing in browser.
 """
 
+import os
 import sqlite3
-import json
+import io
+import html as htmllib
+from urllib.parse import quote
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, Optional, TextIO
 from config import get_config
 
+# orjson is optional; it parses the short keyword arrays several times faster
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 # Get configuration
 config = get_config()
 
+# Applied once when the exporter opens its connection
+_PRAGMAS = (
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA mmap_size=268435456',
+    'PRAGMA cache_size=-65536',
+)
+
+# Per-row fragments, kept at module level so the loops only fill them in
+_FILTER_BTN_TMPL = '''
+            <button class="filter-btn" onclick="filterArticles('{category}')">{label} ({count})</button>'''
+
+_ARTICLE_TMPL = '''
+        <div class="article" data-category="{category}">
+            <div class="article-header">
+                <h2 class="article-title">
+                    <a href="{link}" target="_blank">{title}</a>
+                </h2>
+                <div class="sentiment-badge sentiment-{sentiment_class}">
+                    {sentiment_emoji} {sentiment_score:.2f}
+                </div>
+            </div>
+
+            <div class="article-meta">
+                <div class="meta-item">
+                    <span>&#x1F4FA;</span> {publisher}
+                </div>
+                <div class="meta-item">
+                    <span>&#x1F4C5;</span> {date_str}
+                </div>
+                <div class="meta-item">
+                    <span class="category-tag">{category_label}</span>
+                </div>
+            </div>
+
+            <div class="article-summary">
+                {summary}
+            </div>'''
+
+_KEYWORD_TMPL = '<span class="keyword">{}</span>'
+
+# Sentiment badge lookups, indexed by -1 / 0 / 1 (negative / neutral / positive).
+# Icons are numeric character references so the report templates stay ASCII.
+_SENT_CLASS = {-1: 'negative', 0: 'neutral', 1: 'positive'}
+_SENT_EMOJI = {-1: '&#x1F4C9;', 0: '&#x1F4CA;', 1: '&#x1F4C8;'}
+
+# Report stylesheet and script, written once next to the HTML by export_to_file
+_CSS_BLOB = '''body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    max-width: 1200px;
+    margin: 0 auto;
+    padding: 20px;
+    background-color: #f5f5f5;
+    color: #333;
+}
+
+.header {
+    background: linear-gradient(135deg, #ffd700, #ffed4e);
+    color: #333;
+    padding: 30px;
+    border-radius: 10px;
+    margin-bottom: 30px;
+    text-align: center;
+}
+
+.stats {
+    display: grid;
+    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+    gap: 20px;
+    margin-bottom: 30px;
+}
+
+.stat-card {
+    background: white;
+    padding: 20px;
+    border-radius: 8px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    text-align: center;
+}
+
+.stat-value {
+    font-size: 2em;
+    font-weight: bold;
+    color: #ffd700;
+}
+
+.stat-label {
+    font-size: 0.9em;
+    color: #666;
+    margin-top: 5px;
+}
+
+.filters {
+    background: white;
+    padding: 20px;
+    border-radius: 8px;
+    margin-bottom: 30px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+}
+
+.filter-buttons {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 10px;
+    margin-top: 10px;
+}
+
+.filter-btn {
+    padding: 8px 16px;
+    border: 2px solid #ffd700;
+    background: white;
+    color: #333;
+    border-radius: 20px;
+    cursor: pointer;
+    font-size: 0.9em;
+    transition: all 0.3s;
+}
+
+.filter-btn:hover, .filter-btn.active {
+    background: #ffd700;
+    color: #333;
+}
+
+.articles {
+    display: grid;
+    gap: 20px;
+}
+
+.article {
+    background: white;
+    padding: 25px;
+    border-radius: 8px;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    transition: transform 0.2s, box-shadow 0.2s;
+}
+
+.article:hover {
+    transform: translateY(-2px);
+    box-shadow: 0 4px 8px rgba(0,0,0,0.15);
+}
+
+.article-header {
+    display: flex;
+    justify-content: space-between;
+    align-items: flex-start;
+    margin-bottom: 15px;
+}
+
+.article-title {
+    font-size: 1.3em;
+    font-weight: 600;
+    margin: 0;
+    flex: 1;
+    margin-right: 15px;
+}
+
+.article-title a {
+    color: #333;
+    text-decoration: none;
+}
+
+.article-title a:hover {
+    color: #ffd700;
+}
+
+.sentiment-badge {
+    padding: 4px 12px;
+    border-radius: 20px;
+    font-size: 0.8em;
+    font-weight: bold;
+    white-space: nowrap;
+}
+
+.sentiment-positive {
+    background: #d4edda;
+    color: #155724;
+}
+
+.sentiment-negative {
+    background: #f8d7da;
+    color: #721c24;
+}
+
+.sentiment-neutral {
+    background: #e2e3e5;
+    color: #383d41;
+}
+
+.article-meta {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 15px;
+    font-size: 0.9em;
+    color: #666;
+    margin-bottom: 15px;
+}
+
+.meta-item {
+    display: flex;
+    align-items: center;
+    gap: 5px;
+}
+
+.category-tag {
+    background: #f0f0f0;
+    padding: 4px 8px;
+    border-radius: 12px;
+    font-size: 0.8em;
+    color: #666;
+}
+
+.article-summary {
+    line-height: 1.6;
+    margin-bottom: 15px;
+}
+
+.keywords {
+    display: flex;
+    flex-wrap: wrap;
+    gap: 8px;
+}
+
+.keyword {
+    background: #fff3cd;
+    color: #856404;
+    padding: 2px 8px;
+    border-radius: 10px;
+    font-size: 0.8em;
+}
+
+.footer {
+    text-align: center;
+    margin-top: 50px;
+    padding: 20px;
+    color: #666;
+    font-size: 0.9em;
+}
+
+@media (max-width: 768px) {
+    body {
+        padding: 10px;
+    }
+
+    .header {
+        padding: 20px;
+    }
+
+    .article-header {
+        flex-direction: column;
+        align-items: flex-start;
+    }
+
+    .sentiment-badge {
+        margin-top: 10px;
+    }
+
+    .filter-buttons {
+        justify-content: center;
+    }
+}
+'''
+
+_JS_BLOB = '''function filterArticles(category) {
+    const articles = document.querySelectorAll('.article');
+    const buttons = document.querySelectorAll('.filter-btn');
+
+    // Update active button
+    buttons.forEach(btn => btn.classList.remove('active'));
+    event.target.classList.add('active');
+
+    // Filter articles
+    articles.forEach(article => {
+        if (category === 'all' || article.dataset.category === category) {
+            article.style.display = 'block';
+        } else {
+            article.style.display = 'none';
+        }
+    });
+}
+
+// Add smooth scrolling for better UX
+document.querySelectorAll('a[href^="#"]').forEach(anchor => {
+    anchor.addEventListener('click', function (e) {
+        e.preventDefault();
+        document.querySelector(this.getAttribute('href')).scrollIntoView({
+            behavior: 'smooth'
+        });
+    });
+});
+'''
+
+
+def _write_asset(path: str, content: str):
+    """Write a static report asset unless an identical copy is already there."""
+    try:
+        if os.path.getsize(path) == len(content.encode('utf-8')):
+            with open(path, encoding='utf-8') as f:
+                if f.read() == content:
+                    return
+    except OSError:
+        pass
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+@lru_cache(maxsize=1024)
+def _format_date(raw: Optional[str]) -> str:
+    """Render a stored published_date as 'YYYY-MM-DD HH:MM'."""
+    if not raw:
+        return 'Unknown'
+    value = raw[:-1] + '+00:00' if raw[-1:] == 'Z' else raw
+    try:
+        return datetime.fromisoformat(value).strftime('%Y-%m-%d %H:%M')
+    except ValueError:
+        return raw[:16]
+
+
+def _parse_keywords(raw: Optional[str]) -> list:
+    """Decode the keywords JSON column, skipping the parser for empty values."""
+    if not raw or raw == '[]':
+        return []
+    try:
+        return _json.loads(raw)
+    except ValueError:
+        return []
+
+
+def _esc(value) -> str:
+    """HTML-escape a database value for use in text or attribute context."""
+    return htmllib.escape(str(value or ''), quote=True)
+
+
+def _esc_article(article: Dict) -> Dict:
+    """Return a copy of an article with every interpolated field escaped."""
+    return {
+        **article,
+        'title': _esc(article['title']),
+        'summary': _esc(article['summary'] or 'No summary available.'),
+        'publisher': _esc(article['publisher']),
+        'link': _esc(quote(article['link'] or '', safe=":/?=&#%+;@,~")),
+        'category': _esc(article['category']),
+        'keywords': [_esc(keyword) for keyword in article['keywords']],
+    }
+
 class NewsHTMLExporter:
     def __init__(self, db_path: Optional[str] = None):
         """Initialize the HTML exporter with database path."""
         self.db_path = db_path or config.database_path
-
-    def get_news_data(self, days: int = 7, limit: int = 100) -> List[Dict]:
-        """Get news data from database."""
+        self._conn = self._connect()
+        self._ensure_index()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the exporter's connection, tuned for repeated read-heavy queries."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def close(self):
+        """Close the database connection."""
+        self._conn.close()
+
+    def _ensure_index(self):
+        """Make sure the report window query can use an index on published_date."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                end_date = datetime.now()
-                start_date = end_date - timedelta(days=days)
-
-                query = '''
-                    SELECT id, title, summary, link, publisher, published_date,
-                           sentiment_score, category, keywords
-                    FROM gold_news
-                    WHERE published_date >= ?
-                    ORDER BY published_date DESC
-                    LIMIT ?
-                '''
-
-                cursor = conn.cursor()
-                cursor.execute(query, (start_date.isoformat(), limit))
-
-                articles = []
-                for row in cursor.fetchall():
-                    try:
-                        keywords = json.loads(row[8]) if row[8] else []
-                    except json.JSONDecodeError:
-                        keywords = []
-
-                    articles.append({
-                        'id': row[0],
-                        'title': row[1],
-                        'summary': row[2],
-                        'link': row[3],
-                        'publisher': row[4],
-                        'published_date': row[5],
-                        'sentiment_score': row[6] or 0,
-                        'category': row[7] or 'general',
-                        'keywords': keywords
-                    })
-
-                return articles
+            # Same index the news fetcher creates, for databases it hasn't touched yet
+            self._conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_published_date
+                ON gold_news(published_date)
+            ''')
+        except sqlite3.Error:
+            # No gold_news table yet; get_news_data reports that on use
+            pass
+
+    def _get_news_stats(self, start_date: datetime, limit: int = 100) -> Dict:
+        """Aggregate header stats for the report window inside SQLite."""
+        window = '''
+            SELECT sentiment_score, category
+            FROM gold_news
+            WHERE published_date >= ?
+            ORDER BY published_date DESC
+            LIMIT ?
+        '''
+        params = (start_date.isoformat(), limit)
 
+        try:
+            total, avg_sentiment = self._conn.execute(
+                f"SELECT COUNT(*), AVG(COALESCE(sentiment_score, 0)) FROM ({window})",
+                params
+            ).fetchone()
+            category_counts = dict(self._conn.execute(
+                f"SELECT COALESCE(NULLIF(category, ''), 'general'), COUNT(*) "
+                f"FROM ({window}) GROUP BY 1",
+                params
+            ))
         except sqlite3.Error as e:
             print(f"Database error: {e}")
-            return []
+            total, avg_sentiment, category_counts = 0, 0, {}
 
-    def generate_html(self, articles: List[Dict], title: str = "Gold News Report") -> str:
-        """Generate HTML content for news articles."""
+        return {
+            'total_articles': total,
+            'avg_sentiment': avg_sentiment or 0,
+            'category_counts': category_counts,
+        }
 
-        # Calculate stats
-        total_articles = len(articles)
-        avg_sentiment = sum(a['sentiment_score'] for a in articles) / total_articles if total_articles > 0 else 0
+    def get_news_data(self, days: int = 7, limit: int = 100,
+                      start_date: Optional[datetime] = None) -> Iterator[Dict]:
+        """Yield news articles from the database, newest first."""
+        if start_date is None:
+            start_date = datetime.now() - timedelta(days=days)
 
-        # Count categories
-        category_counts = {}
-        for article in articles:
-            cat = article['category']
-            category_counts[cat] = category_counts.get(cat, 0) + 1
+        try:
+            query = '''
+                SELECT id, title, summary, link, publisher, published_date,
+                       sentiment_score, category, keywords
+                FROM gold_news
+                WHERE published_date >= ?
+                ORDER BY published_date DESC
+                LIMIT ?
+            '''
+
+            cursor = self._conn.cursor()
+            cursor.execute(query, (start_date.isoformat(), limit))
+
+            for row in cursor:
+                article = dict(row)
+                article['sentiment_score'] = row['sentiment_score'] or 0
+                article['category'] = row['category'] or 'general'
+                article['keywords'] = _parse_keywords(row['keywords'])
+                yield article
+
+        except sqlite3.Error as e:
+            print(f"Database error: {e}")
 
-        html = f'''<!DOCTYPE html>
+    def generate_html(self, articles: Iterable[Dict], stats: Dict,
+                      title: str = "Gold News Report", assets: str = "gold_news_report") -> str:
+        """Generate HTML content for news articles."""
+        buffer = io.StringIO()
+        self.write_html(articles, buffer, stats, title, assets)
+        return buffer.getvalue()
+
+    def write_html(self, articles: Iterable[Dict], fp: TextIO, stats: Dict,
+                   title: str = "Gold News Report", assets: str = "gold_news_report"):
+        """Write HTML content for news articles to an open text file.
+
+        ``stats`` comes from ``_get_news_stats`` for the same window, so the
+        header can be written up front and the articles streamed after it.
+        The page links ``<assets>.css`` and ``<assets>.js`` relative to itself.
+        """
+        total_articles = stats['total_articles']
+        avg_sentiment = stats['avg_sentiment']
+        category_counts = stats['category_counts']
+
+        write = fp.write
+        write(f'''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{title}</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            max-width: 1200px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-            color: #333;
-        }}
-
-        .header {{
-            background: linear-gradient(135deg, #ffd700, #ffed4e);
-            color: #333;
-            padding: 30px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-            text-align: center;
-        }}
-
-        .stats {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-
-        .stat-card {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            text-align: center;
-        }}
-
-        .stat-value {{
-            font-size: 2em;
-            font-weight: bold;
-            color: #ffd700;
-        }}
-
-        .stat-label {{
-            font-size: 0.9em;
-            color: #666;
-            margin-top: 5px;
-        }}
-
-        .filters {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            margin-bottom: 30px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-
-        .filter-buttons {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 10px;
-            margin-top: 10px;
-        }}
-
-        .filter-btn {{
-            padding: 8px 16px;
-            border: 2px solid #ffd700;
-            background: white;
-            color: #333;
-            border-radius: 20px;
-            cursor: pointer;
-            font-size: 0.9em;
-            transition: all 0.3s;
-        }}
-
-        .filter-btn:hover, .filter-btn.active {{
-            background: #ffd700;
-            color: #333;
-        }}
-
-        .articles {{
-            display: grid;
-            gap: 20px;
-        }}
-
-        .article {{
-            background: white;
-            padding: 25px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-            transition: transform 0.2s, box-shadow 0.2s;
-        }}
-
-        .article:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 4px 8px rgba(0,0,0,0.15);
-        }}
-
-        .article-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: flex-start;
-            margin-bottom: 15px;
-        }}
-
-        .article-title {{
-            font-size: 1.3em;
-            font-weight: 600;
-            margin: 0;
-            flex: 1;
-            margin-right: 15px;
-        }}
-
-        .article-title a {{
-            color: #333;
-            text-decoration: none;
-        }}
-
-        .article-title a:hover {{
-            color: #ffd700;
-        }}
-
-        .sentiment-badge {{
-            padding: 4px 12px;
-            border-radius: 20px;
-            font-size: 0.8em;
-            font-weight: bold;
-            white-space: nowrap;
-        }}
-
-        .sentiment-positive {{
-            background: #d4edda;
-            color: #155724;
-        }}
-
-        .sentiment-negative {{
-            background: #f8d7da;
-            color: #721c24;
-        }}
-
-        .sentiment-neutral {{
-            background: #e2e3e5;
-            color: #383d41;
-        }}
-
-        .article-meta {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 15px;
-            font-size: 0.9em;
-            color: #666;
-            margin-bottom: 15px;
-        }}
-
-        .meta-item {{
-            display: flex;
-            align-items: center;
-            gap: 5px;
-        }}
-
-        .category-tag {{
-            background: #f0f0f0;
-            padding: 4px 8px;
-            border-radius: 12px;
-            font-size: 0.8em;
-            color: #666;
-        }}
-
-        .article-summary {{
-            line-height: 1.6;
-            margin-bottom: 15px;
-        }}
-
-        .keywords {{
-            display: flex;
-            flex-wrap: wrap;
-            gap: 8px;
-        }}
-
-        .keyword {{
-            background: #fff3cd;
-            color: #856404;
-            padding: 2px 8px;
-            border-radius: 10px;
-            font-size: 0.8em;
-        }}
-
-        .footer {{
-            text-align: center;
-            margin-top: 50px;
-            padding: 20px;
-            color: #666;
-            font-size: 0.9em;
-        }}
-
-        @media (max-width: 768px) {{
-            body {{
-                padding: 10px;
-            }}
-
-            .header {{
-                padding: 20px;
-            }}
-
-            .article-header {{
-                flex-direction: column;
-                align-items: flex-start;
-            }}
-
-            .sentiment-badge {{
-                margin-top: 10px;
-            }}
-
-            .filter-buttons {{
-                justify-content: center;
-            }}
-        }}
-    </style>
+    <link rel="stylesheet" href="{assets}.css">
 </head>
 <body>
     <div class="header">
-        <h1>🏆 {title}</h1>
+        <h1>&#x1F3C6; {title}</h1>
         <p>Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
     </div>
 
@@ -319,138 +510,114 @@ class NewsHTMLExporter:
     </div>
 
     <div class="filters">
-        <h3>📂 Filter by Category</h3>
+        <h3>&#x1F4C2; Filter by Category</h3>
         <div class="filter-buttons">
-            <button class="filter-btn active" onclick="filterArticles('all')">All</button>'''
+            <button class="filter-btn active" onclick="filterArticles('all')">All</button>''')
 
         # Add category filter buttons
         for category in sorted(category_counts.keys()):
-            display_name = category.replace('_', ' ').title()
-            html += f'''
-            <button class="filter-btn" onclick="filterArticles('{category}')">{display_name} ({category_counts[category]})</button>'''
+            display_name = _esc(category.replace('_', ' ').title())
+            write(_FILTER_BTN_TMPL.format(
+                category=_esc(category), label=display_name, count=category_counts[category]))
 
-        html += '''
+        write('''
         </div>
     </div>
 
-    <div class="articles" id="articles">'''
+    <div class="articles" id="articles">''')
 
         # Add articles
         for article in articles:
-            sentiment_class = 'positive' if article['sentiment_score'] > 0.1 else 'negative' if article['sentiment_score'] < -0.1 else 'neutral'
-            sentiment_emoji = '📈' if article['sentiment_score'] > 0.1 else '📉' if article['sentiment_score'] < -0.1 else '📊'
-
-            # Format date
-            try:
-                pub_date = datetime.fromisoformat(article['published_date'].replace('Z', '+00:00'))
-                date_str = pub_date.strftime('%Y-%m-%d %H:%M')
-            except:
-                date_str = article['published_date'][:16] if article['published_date'] else 'Unknown'
-
-            html += f'''
-        <div class="article" data-category="{article['category']}">
-            <div class="article-header">
-                <h2 class="article-title">
-                    <a href="{article['link']}" target="_blank">{article['title']}</a>
-                </h2>
-                <div class="sentiment-badge sentiment-{sentiment_class}">
-                    {sentiment_emoji} {article['sentiment_score']:.2f}
-                </div>
-            </div>
-
-            <div class="article-meta">
-                <div class="meta-item">
-                    <span>📺</span> {article['publisher']}
-                </div>
-                <div class="meta-item">
-                    <span>📅</span> {date_str}
-                </div>
-                <div class="meta-item">
-                    <span class="category-tag">{article['category'].replace('_', ' ').title()}</span>
-                </div>
-            </div>
-
-            <div class="article-summary">
-                {article['summary'] or 'No summary available.'}
-            </div>'''
+            article = _esc_article(article)
+            score = article['sentiment_score']
+            bucket = (score > 0.1) - (score < -0.1)
+            sentiment_class = _SENT_CLASS[bucket]
+            sentiment_emoji = _SENT_EMOJI[bucket]
+
+            write(_ARTICLE_TMPL.format_map({
+                **article,
+                'category_label': article['category'].replace('_', ' ').title(),
+                'sentiment_class': sentiment_class,
+                'sentiment_emoji': sentiment_emoji,
+                'date_str': _format_date(article['published_date']),
+            }))
 
             if article['keywords']:
-                html += '''
-            <div class="keywords">'''
+                write('''
+            <div class="keywords">''')
                 for keyword in article['keywords'][:8]:  # Show max 8 keywords
-                    html += f'<span class="keyword">{keyword}</span>'
-                html += '''
-            </div>'''
+                    write(_KEYWORD_TMPL.format(keyword))
+                write('''
+            </div>''')
 
-            html += '''
-        </div>'''
+            write('''
+        </div>''')
 
-        html += '''
+        write(f'''
     </div>
 
     <div class="footer">
-        <p>📰 Gold News Report | Generated by Gold Digger System</p>
-        <p>⚠️ This data is for educational purposes only. Always do your own research.</p>
+        <p>&#x1F4F0; Gold News Report | Generated by Gold Digger System</p>
+        <p>&#x26A0;&#xFE0F; This data is for educational purposes only. Always do your own research.</p>
     </div>
 
-    <script>
-        function filterArticles(category) {
-            const articles = document.querySelectorAll('.article');
-            const buttons = document.querySelectorAll('.filter-btn');
-
-            // Update active button
-            buttons.forEach(btn => btn.classList.remove('active'));
-            event.target.classList.add('active');
-
-            // Filter articles
-            articles.forEach(article => {
-                if (category === 'all' || article.dataset.category === category) {
-                    article.style.display = 'block';
-                } else {
-                    article.style.display = 'none';
-                }
-            });
-        }
-
-        // Add smooth scrolling for better UX
-        document.querySelectorAll('a[href^="#"]').forEach(anchor => {
-            anchor.addEventListener('click', function (e) {
-                e.preventDefault();
-                document.querySelector(this.getAttribute('href')).scrollIntoView({
-                    behavior: 'smooth'
-                });
-            });
-        });
-    </script>
+    <script src="{assets}.js"></script>
 </body>
-</html>'''
+</html>''')
 
-        return html
 
     def export_to_file(self, filename: str = "gold_news_report.html", days: int = 7) -> bool:
         """Export news to HTML file."""
         try:
-            articles = self.get_news_data(days)
+            start_date = datetime.now() - timedelta(days=days)
+            stats = self._get_news_stats(start_date)
 
-            if not articles:
+            if not stats['total_articles']:
                 print("❌ No articles found for export")
                 return False
 
             title = f"Gold News Report - Last {days} Days"
-            html_content = self.generate_html(articles, title)
+            articles = self.get_news_data(start_date=start_date)
+
+            # Stylesheet and script live next to the report so browsers can cache them
+            base = os.path.splitext(filename)[0]
+            _write_asset(base + '.css', _CSS_BLOB)
+            _write_asset(base + '.js', _JS_BLOB)
 
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            # Encode straight into a 1 MiB binary buffer: write_through skips the
+            # text layer's own buffering and newline='' skips newline translation
+            with open(filename, 'wb', buffering=1 << 20) as raw, \
+                    io.TextIOWrapper(raw, encoding='utf-8', newline='', write_through=True) as f:
+                self.write_html(articles, f, stats, title, os.path.basename(base))
 
-            print(f"✅ Exported {len(articles)} articles to {filename}")
+            print(f"✅ Exported {stats['total_articles']} articles to {filename}")
             return True
 
         except Exception as e:
             print(f"❌ Export failed: {e}")
             return False
 
+def run(output: str = "gold_news_report.html", days: int = 7,
+        exporter: Optional[NewsHTMLExporter] = None) -> bool:
+    """Export the last `days` of news to `output`.
+
+    A passed-in exporter is reused and left open; otherwise a temporary one
+    is created and closed.
+    """
+    if exporter is not None:
+        return exporter.export_to_file(output, days)
+
+    exporter = NewsHTMLExporter()
+    try:
+        return exporter.export_to_file(output, days)
+    finally:
+        exporter.close()
+
+
 def main():
     """Main function for HTML export."""
+    config.init()
+
     import argparse
 
     parser = argparse.ArgumentParser(description='Export Gold News to HTML')
@@ -461,10 +628,7 @@ def main():
 
     args = parser.parse_args()
 
-    exporter = NewsHTMLExporter()
-    success = exporter.export_to_file(args.output, args.days)
-
-    if success:
+    if run(output=args.output, days=args.days):
         print(f"🌐 Open {args.output} in your browser to view the news report")
 
 if __name__ == "__main__":
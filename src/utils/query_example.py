@@ -6,19 +6,31 @@ Demonstrates various ways to analyze the cached data.
 
 import sqlite3
 import pandas as pd
+from contextlib import contextmanager
 from datetime import datetime, timedelta
+from typing import Optional
 import matplotlib.pyplot as plt
 import sys
 
 class GoldDataAnalyzer:
-    def __init__(self, db_path: str = "gold_prices.db"):
-        """Initialize the analyzer with the database path."""
+    def __init__(self, db_path: str = "gold_prices.db", conn: Optional[sqlite3.Connection] = None):
+        """Initialize the analyzer with the database path, or an open connection to share."""
         self.db_path = db_path
+        self.conn = conn
+
+    @contextmanager
+    def _connection(self):
+        """Yield the shared connection if one was given, otherwise a fresh one."""
+        if self.conn is not None:
+            yield self.conn
+        else:
+            with sqlite3.connect(self.db_path) as conn:
+                yield conn
 
     def get_latest_prices(self):
         """Get the latest gold prices for both intervals."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 # Get latest 15m price
                 query_15m = '''
                     SELECT datetime, close FROM gold_prices_15m
@@ -49,7 +61,7 @@ class GoldDataAnalyzer:
     def get_daily_summary(self, days: int = 7):
         """Get daily high, low, and close for the last N days."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=days)
 
@@ -83,7 +95,7 @@ class GoldDataAnalyzer:
     def get_price_changes(self, interval: str = "15m"):
         """Calculate price changes over different periods."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 table_name = f"gold_prices_{interval}"
 
                 query = f'''
@@ -137,7 +149,7 @@ class GoldDataAnalyzer:
     def export_to_csv(self, interval: str = "15m", days: int = 14, filename: str = None):
         """Export cached data to CSV file."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 table_name = f"gold_prices_{interval}"
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=days)
@@ -165,7 +177,7 @@ class GoldDataAnalyzer:
         try:
             import matplotlib.pyplot as plt
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 table_name = f"gold_prices_{interval}"
                 end_date = datetime.now()
                 start_date = end_date - timedelta(days=days)
@@ -0,0 +1,6 @@
+"""
+Web interface for Gold Digger trading analysis system.
+
+This package contains the Flask dashboard (app.py) together with its
+templates and static assets. Launch it through gold_digger_web.py.
+"""
@@ -40,6 +40,7 @@ CORS(app)
 
 # Get configuration
 config = get_config()
+config.init()
 
 # Set database path to data directory to use the main database
 db_path = os.path.join(parent_dir, 'data', 'gold_prices.db')
@@ -551,9 +552,12 @@ def main():
     """Run the Flask application."""
     port = int(os.environ.get('PORT', 5000))
     debug = os.environ.get('FLASK_ENV') == 'development'
+    # The reloader re-imports this module in a child process, building every
+    # component twice, so only use it when auto-reload was asked for
+    use_reloader = debug and os.environ.get('GD_USE_RELOADER') == '1'
 
-    # Check if port is in use and find alternative
-    if is_port_in_use(port):
+    # Inside the reloader child the parent already holds the socket on PORT
+    if os.environ.get('WERKZEUG_RUN_MAIN') != 'true' and is_port_in_use(port):
         print(f"⚠️  Port {port} is in use, trying alternative ports...")
         for alternative_port in range(5001, 5010):
             if not is_port_in_use(alternative_port):
@@ -573,7 +577,7 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
 
     try:
-        app.run(host='0.0.0.0', port=port, debug=debug, threaded=True)
+        app.run(host='0.0.0.0', port=port, debug=debug, use_reloader=use_reloader, threaded=True)
     except OSError as e:
         if "Address already in use" in str(e):
             print(f"❌ Port {port} became unavailable. Please try again.")